@@ -0,0 +1,77 @@
+# bench_startup.py
+#
+# Measures interpreter + import cost of the CLI start-up path and asserts
+# that the compute modules load without matplotlib or tkinter.
+#
+#   python benchmarks/bench_startup.py [--repeat 10] [--json out.json]
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "src")
+
+COMPUTE_MODULES = ["materials", "section", "rebar", "interaction_diagram", "section_solver", "envelope"]
+HEAVY_MODULES = ["matplotlib", "tkinter"]
+
+# Import targets timed in a fresh interpreter each
+TARGETS = {
+    "python_baseline": "pass",
+    "compute_modules": "import " + ", ".join(COMPUTE_MODULES),
+    "main_entry": "import main",
+    "plotting_modules": "import interaction_plot",
+}
+
+
+def time_import(statement: str, repeat: int) -> dict:
+    """Runs the statement in `repeat` fresh interpreters and returns wall-clock stats (ms)."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], cwd=SRC_DIR, check=True)
+        samples.append((time.perf_counter() - start) * 1e3)
+    return {
+        "median_ms": round(statistics.median(samples), 2),
+        "min_ms": round(min(samples), 2),
+        "repeat": repeat,
+    }
+
+
+def heavy_modules_loaded(statement: str) -> list[str]:
+    """Returns the heavy modules present in sys.modules after the statement runs."""
+    probe = f"{statement}\nimport sys\nprint(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    out = subprocess.run([sys.executable, "-c", probe], cwd=SRC_DIR, check=True,
+                         capture_output=True, text=True).stdout.strip()
+    return [m for m in out.split(",") if m]
+
+
+def run(repeat: int = 10) -> dict:
+    results = {name: time_import(stmt, repeat) for name, stmt in TARGETS.items()}
+    results["lazy_check"] = {
+        "compute_modules": heavy_modules_loaded(TARGETS["compute_modules"]),
+        "main_entry": heavy_modules_loaded(TARGETS["main_entry"]),
+    }
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="CLI start-up benchmark")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--json", default=None, help="Write results to this file")
+    args = parser.parse_args()
+
+    results = run(args.repeat)
+    text = json.dumps(results, indent=2)
+    print(text)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            f.write(text)
+
+    leaked = results["lazy_check"]["compute_modules"] + results["lazy_check"]["main_entry"]
+    if leaked:
+        sys.exit(f"Heavy modules imported on the compute path: {sorted(set(leaked))}")
@@ -0,0 +1,223 @@
+# run_benchmarks.py
+#
+# Local benchmark suite for the compute hot paths.
+#
+#   python benchmarks/run_benchmarks.py --json bench_results.json
+#   python benchmarks/run_benchmarks.py --quick --compare bench_results.json
+#
+# Results are written as JSON (one record per case) so runs from
+# different commits can be compared with --compare.
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.normpath(os.path.join(HERE, os.pardir, "src"))
+sys.path.insert(0, SRC_DIR)
+
+import numpy as np
+from materials import Material
+from section import Section
+from rebar import RebarLayout
+from interaction_diagram import generate_interaction_diagram, generate_interaction_arrays
+from section_solver import generate_section_diagram
+from steel_stress import steel_stress, steel_stress_array
+from load_check import check_loads_batch
+from envelope import InteractionEnvelope
+from save_utils import save_summary
+
+
+def measure(func, repeat: int = 5, min_time: float = 0.05) -> dict:
+    """
+    Times func() with auto-scaled inner loops; reports per-call seconds.
+    """
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or number >= 1 << 20:
+            break
+        number *= 2
+
+    samples = [elapsed / number]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number)
+
+    return {
+        "best_s": min(samples),
+        "median_s": statistics.median(samples),
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def sample_section():
+    material = Material(name="C30", fck=30, fyk=500)
+    section = Section(width_mm=300, depth_mm=500)
+    layout = RebarLayout()
+    layout.add_group(20, 3, 50)
+    layout.add_group(16, 2, 250)
+    layout.add_group(20, 3, 450)
+    return material, section, layout
+
+
+# ---- Cases ----
+
+def bench_diagram(quick: bool) -> list[tuple]:
+    material, section, layout = sample_section()
+    steps_list = [20, 200, 2000] if quick else [20, 200, 2000, 10000]
+    records = []
+    for steps in steps_list:
+        # Materialises every InteractionPoint, unlike the lazy DiagramResult itself
+        records.append(("diagram.points", {"steps": steps}, lambda steps=steps: list(generate_interaction_diagram(
+            section.width_mm, section.depth_mm, material.fcd, steps))))
+        records.append(("diagram.arrays", {"steps": steps}, lambda steps=steps: generate_interaction_arrays(
+            section.width_mm, section.depth_mm, material.fcd, steps)))
+        records.append(("diagram.section_solver", {"steps": steps}, lambda steps=steps: generate_section_diagram(
+            section, material, layout, steps)))
+    return records
+
+
+def bench_steel_stress(quick: bool) -> list[tuple]:
+    sizes = [10**3, 10**5] if quick else [10**3, 10**5, 10**6]
+    rng = np.random.default_rng(0)
+    records = []
+    for n in sizes:
+        strains = rng.uniform(-0.01, 0.0035, n)
+        records.append(("steel_stress.array", {"n": n}, lambda strains=strains: steel_stress_array(strains, 435.0)))
+        if n <= 10**5:
+            values = strains.tolist()
+            records.append(("steel_stress.scalar_loop", {"n": n},
+                            lambda values=values: [steel_stress(e, 435.0) for e in values]))
+    return records
+
+
+def bench_load_check(quick: bool) -> list[tuple]:
+    material, section, layout = sample_section()
+    diagram = generate_section_diagram(section, material, layout, 200)
+    envelope = InteractionEnvelope(diagram)
+
+    sizes = [10**3, 10**4, 10**5] if quick else [10**3, 10**4, 10**5, 10**6]
+    rng = np.random.default_rng(1)
+    records = [("envelope.build", {"steps": 200}, lambda: InteractionEnvelope(diagram))]
+    for n in sizes:
+        N = rng.uniform(-5e5, 3e6, n)
+        M = rng.uniform(-3e8, 3e8, n)
+        records.append(("load_check.batch_envelope", {"n": n}, lambda N=N, M=M: check_loads_batch(N, M, envelope)))
+        records.append(("load_check.batch_arrays", {"n": n}, lambda N=N, M=M: check_loads_batch(N, M, diagram)))
+        if n <= 10**4:
+            pairs = list(zip(N.tolist(), M.tolist()))
+            # Same ray test as the batch rows, one load per call
+            records.append(("load_check.scalar_loop", {"n": n}, lambda pairs=pairs: [
+                envelope.utilisation(n_, m_) for n_, m_ in pairs]))
+    return records
+
+
+def bench_end_to_end(quick: bool) -> list[tuple]:
+    material, section, layout = sample_section()
+    out_dir = tempfile.mkdtemp(prefix="rc_bench_")
+
+    def pipeline():
+        points = generate_interaction_diagram(section.width_mm, section.depth_mm, material.fcd)
+        save_summary(material, section, points, out_dir=out_dir)
+
+    def cli_run():
+        subprocess.run(
+            [sys.executable, os.path.join(SRC_DIR, "main.py"), "--code", "EUROCODE",
+             "--width_mm", "300", "--depth_mm", "500", "--fck", "30", "--fyk", "500",
+             "--no_show", "--save_summary"],
+            cwd=out_dir, check=True, stdout=subprocess.DEVNULL
+        )
+
+    return [
+        ("end_to_end.in_process", {}, pipeline),
+        ("end_to_end.cli_subprocess", {}, cli_run),
+    ]
+
+
+SUITES = {
+    "diagram": bench_diagram,
+    "steel_stress": bench_steel_stress,
+    "load_check": bench_load_check,
+    "end_to_end": bench_end_to_end,
+}
+
+
+def run(suites: list[str], quick: bool) -> dict:
+    results = []
+    for suite in suites:
+        for name, params, func in SUITES[suite](quick):
+            # Silence prints from save_summary and friends while timing
+            with open(os.devnull, "w") as devnull:
+                stdout, sys.stdout = sys.stdout, devnull
+                try:
+                    stats = measure(func, repeat=3 if quick else 5)
+                finally:
+                    sys.stdout = stdout
+            record = {"case": name, "params": params, **stats}
+            results.append(record)
+            print(f"{name:32s} {json.dumps(params):18s} {stats['best_s'] * 1e3:12.4f} ms")
+
+    return {"meta": environment_info(), "results": results}
+
+
+def environment_info() -> dict:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=HERE,
+                                capture_output=True, text=True).stdout.strip()
+    except OSError:
+        commit = ""
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def compare(current: dict, baseline_path: str):
+    """Prints best-time ratios (current / baseline) for matching cases."""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)
+
+    key = lambda r: (r["case"], json.dumps(r["params"], sort_keys=True))
+    old = {key(r): r for r in baseline["results"]}
+
+    print(f"\nvs {baseline['meta'].get('commit') or baseline_path}:")
+    for record in current["results"]:
+        previous = old.get(key(record))
+        if previous:
+            ratio = record["best_s"] / previous["best_s"]
+            flag = "  ⚠️ slower" if ratio > 1.10 else ""
+            print(f"{record['case']:32s} {json.dumps(record['params']):18s} {ratio:8.2f}x{flag}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="RC Section Designer benchmarks")
+    parser.add_argument("--suite", action="append", choices=list(SUITES),
+                        help="Run only these suites (repeatable; default: all)")
+    parser.add_argument("--quick", action="store_true", help="Smaller sizes and fewer repeats")
+    parser.add_argument("--json", default=None, help="Write machine-readable results here")
+    parser.add_argument("--compare", default=None, help="Baseline JSON to compare against")
+    args = parser.parse_args()
+
+    results = run(args.suite or list(SUITES), args.quick)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    if args.compare:
+        compare(results, args.compare)
@@ -0,0 +1,159 @@
+# analytic_section.py
+
+import numpy as np
+from interaction_diagram import InteractionArrays
+from section_solver import E_S, EPS_CU, ALPHA_CC, LAMBDA, yield_breakpoints
+
+
+class AnalyticSection:
+    """
+    Closed-form N(x) and M(x) for a rectangular section with stress block
+    and elastic-plastic bars.
+
+    Between consecutive breakpoints (bar yield depths and x = h/λ) every
+    contribution is exact in the form
+
+        f(x) = c0 + c1·x + c2·x² + c_inv / x
+
+    The concrete block gives the polynomial part. Each elastic bar gives
+    A·Es·εcu·(1 − d/x), i.e. a constant plus a 1/x term. The coefficients
+    are summed per segment once, so evaluating any number of x values is a
+    searchsorted plus a Horner step.
+
+    Parameters:
+        section (Section): Rectangular section
+        material (Material): Material with fcd and fyd
+        layout (RebarLayout): Reinforcement layout
+        eps_cu (float): Ultimate concrete strain
+
+    Methods:
+        evaluate(x): InteractionArrays at the given neutral axis depths
+        diagram(points_per_segment): Envelope sampled segment by segment
+        moment_capacity(N): Exact M_Rd at axial force N (cubic root per call)
+    """
+
+    def __init__(self, section, material, layout, eps_cu: float = EPS_CU):
+        h = section.depth_mm
+        self.depth_mm = h
+        self.eps_cu = eps_cu
+
+        areas, depths = layout.as_arrays()
+        fyd = material.fyd
+        eps_y = fyd / E_S
+
+        # Segments start at x = 0 and at every kink of the envelope
+        self.breaks = np.concatenate([[0.0], yield_breakpoints(depths, fyd, h, eps_cu)])
+        K = self.breaks.size
+
+        # Representative x inside each segment decides every bar's regime
+        upper = np.append(self.breaks[1:], 2 * self.breaks[-1] + 1.0)
+        mid = (self.breaks + upper) / 2
+
+        N_coef = np.zeros((K, 4))   # c0, c1, c2, c_inv
+        M_coef = np.zeros((K, 4))
+
+        # Concrete block: N = kλx, M = kλx·(h/2 − λx/2) until λx reaches h
+        k = ALPHA_CC * material.fcd * section.width_mm
+        partial = mid < h / LAMBDA
+        N_coef[partial, 1] = k * LAMBDA
+        M_coef[partial, 1] = k * LAMBDA * h / 2
+        M_coef[partial, 2] = -k * LAMBDA ** 2 / 2
+        N_coef[~partial, 0] = k * h
+
+        if areas.size:
+            strain = eps_cu * (1.0 - depths[None, :] / mid[:, None])   # (K, n_bars)
+            elastic = np.abs(strain) <= eps_y
+            yielded = np.where(elastic, 0.0, np.sign(strain) * fyd * areas[None, :])
+            arm = h / 2 - depths
+
+            c0 = yielded + np.where(elastic, areas[None, :] * E_S * eps_cu, 0.0)
+            c_inv = np.where(elastic, -areas[None, :] * E_S * eps_cu * depths[None, :], 0.0)
+
+            N_coef[:, 0] += c0.sum(axis=1)
+            N_coef[:, 3] += c_inv.sum(axis=1)
+            M_coef[:, 0] += c0 @ arm
+            M_coef[:, 3] += c_inv @ arm
+
+        self._N_coef = N_coef
+        self._M_coef = M_coef
+
+    @staticmethod
+    def _horner(coef, x):
+        # x = 0 only meets zero 1/x terms and x = inf only zero x, x² terms
+        with np.errstate(divide='ignore', invalid='ignore'):
+            inverse = np.where(coef[:, 3] != 0, coef[:, 3] / x, 0.0)
+            poly = np.where(np.isfinite(x), (coef[:, 2] * x + coef[:, 1]) * x, 0.0)
+        return coef[:, 0] + poly + inverse
+
+    def evaluate(self, x) -> InteractionArrays:
+        """
+        Exact N and M about the centroid at neutral axis depths x.
+
+        Parameters:
+            x (array-like): Neutral axis depths (mm), may include np.inf
+
+        Returns:
+            InteractionArrays: x, N (N), M (N·mm)
+        """
+        x = np.atleast_1d(np.asarray(x, dtype=float))
+        seg = np.clip(np.searchsorted(self.breaks, x, side="right") - 1, 0, self.breaks.size - 1)
+        return InteractionArrays(x, self._horner(self._N_coef[seg], x), self._horner(self._M_coef[seg], x))
+
+    def diagram(self, points_per_segment: int = 8) -> InteractionArrays:
+        """
+        Envelope sampled on every segment, breakpoints included exactly.
+
+        Parameters:
+            points_per_segment (int): Samples per smooth segment
+
+        Returns:
+            InteractionArrays: From pure tension (x = 0) to squash load (x = inf)
+        """
+        t = np.arange(points_per_segment) / points_per_segment
+        starts, ends = self.breaks[:-1], self.breaks[1:]
+        x = (starts[:, None] + (ends - starts)[:, None] * t[None, :]).ravel()
+        return self.evaluate(np.concatenate([x, [self.breaks[-1], np.inf]]))
+
+    def moment_capacity(self, N: float) -> float:
+        """
+        Exact M_Rd at axial force N, or NaN outside the envelope.
+
+        N(x) is increasing in x, so the segment is found from the values at
+        the breakpoints; inside it N(x) = N is the cubic
+        c2·x³ + c1·x² + (c0 − N)·x + c_inv = 0.
+        """
+        edges = self.evaluate(np.append(self.breaks, np.inf)).axial_force_N
+        if not edges[0] <= N <= edges[-1]:
+            return float("nan")
+
+        seg = min(int(np.searchsorted(edges, N, side="right")) - 1, self.breaks.size - 1)
+        lo = self.breaks[seg]
+        hi = self.breaks[seg + 1] if seg + 1 < self.breaks.size else np.inf
+
+        c0, c1, c2, c_inv = self._N_coef[seg]
+        if c1 == 0 and c2 == 0:
+            # N = c0 + c_inv/x  →  x = c_inv / (N − c0)
+            roots = np.array([c_inv / (N - c0)]) if N != c0 else np.array([hi])
+        else:
+            roots = np.roots([c2, c1, c0 - N, c_inv])
+        roots = roots[np.isreal(roots)].real
+        roots = roots[(roots >= lo - 1e-9) & (roots <= hi + 1e-9)]
+        x = roots[0] if roots.size else (hi if np.isinf(hi) else lo)
+
+        return float(self.evaluate([x]).bending_moment_Nmm[0])
+
+
+# Optional test block
+if __name__ == "__main__":
+    from materials import Material
+    from section import Section
+    from rebar import RebarLayout
+
+    material = Material(name="C30", fck=30, fyk=500)
+    section = Section(width_mm=300, depth_mm=500)
+    layout = RebarLayout()
+    layout.add_group(20, 3, 50)
+    layout.add_group(20, 3, 450)
+
+    analytic = AnalyticSection(section, material, layout)
+    print(f"{analytic.breaks.size} segments, M_Rd(1000 kN) = {analytic.moment_capacity(1e6) / 1e6:.2f} kNm")
@@ -0,0 +1,321 @@
+# batch_runner.py
+
+import csv
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+import numpy as np
+from materials import Material, DesignCode
+from section import Section
+from rebar import RebarLayout
+from diagram_cache import DiagramCache, diagram_key
+from envelope import InteractionEnvelope
+from export import DiagramStreamWriter
+from load_combinations import check_combinations
+from instrumentation import default_instrumentation as instrumentation
+
+RESULT_FIELDS = [
+    'id', 'width_mm', 'depth_mm', 'fck', 'fyk', 'code', 'steel_area_mm2',
+    'load_count', 'max_utilisation', 'governing_load', 'passes',
+    'max_axial_kN', 'max_moment_kNm', 'error'
+]
+
+# Per-process diagram cache, created by _init_worker
+_worker_cache = None
+
+
+def load_schedule(path: str) -> list[dict]:
+    """
+    Reads a member schedule from JSON.
+
+    Expected format:
+        {"members": [
+            {"id": "C1", "width_mm": 300, "depth_mm": 500, "fck": 30, "fyk": 500,
+             "code": "EUROCODE",
+             "rebar": [{"diameter": 20, "count": 3, "depth": 50}, ...],
+             "loads": [[N, M], ...]}     # N and N·mm, compression positive
+        ]}
+
+    Instead of "loads", a member may give characteristic action effects,
+    "actions": {"permanent": [[N, M], ...],
+                "variable": [{"category": "imposed" | "wind" | "snow", "N": ..., "M": ...}, ...]},
+    whose ULS combinations are generated and checked in streaming chunks.
+
+    Returns:
+        list[dict]: Member entries in schedule order
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return data["members"] if isinstance(data, dict) else data
+
+
+def build_member(member: dict) -> tuple[Section, Material, RebarLayout]:
+    """Creates the Section, Material and RebarLayout for one schedule entry."""
+    code = DesignCode[member.get('code', 'EUROCODE').upper()]
+    material = Material(
+        name=f"C{member['fck']}",
+        fck=member['fck'],
+        fyk=member['fyk'],
+        code=code
+    )
+    section = Section(width_mm=member['width_mm'], depth_mm=member['depth_mm'])
+    layout = RebarLayout()
+    layout.load_from_list(member.get('rebar', []))
+    return section, material, layout
+
+
+def evaluate_member(member: dict, steps: int = 200, cache: DiagramCache = None) -> dict:
+    """
+    Generates (or reuses) the member's envelope and checks all its loads.
+
+    Parameters:
+        member (dict): One schedule entry
+        steps (int): Neutral-axis steps per diagram
+        cache (DiagramCache, optional): Diagram cache to use
+
+    Returns:
+        dict: One results-table row (see RESULT_FIELDS)
+    """
+    return _evaluate(member, steps, cache)[0]
+
+
+def _evaluate(member: dict, steps: int, cache: DiagramCache) -> tuple:
+    """Returns (row, diagram, utilisation); arrays are None on error, utilisation also for action members."""
+    diagram = utilisation = None
+    row = {field: member.get(field) for field in ('id', 'width_mm', 'depth_mm', 'fck', 'fyk')}
+    row['code'] = str(member.get('code', 'EUROCODE')).upper()
+
+    try:
+        section, material, layout = build_member(member)
+        cache = cache if cache is not None else DiagramCache()
+        diagram = cache.get_or_compute(section, material, layout, steps)
+        envelope = InteractionEnvelope(diagram, cache.get_or_compute_hogging(section, material, layout, steps))
+
+        if 'actions' in member:
+            # Combinations are streamed, so no per-load utilisation array is kept
+            actions = member['actions']
+            with instrumentation.stage("load_check"):
+                result = check_combinations(
+                    envelope, actions.get('permanent', []), actions.get('variable', []), material.code
+                )
+            load_count, governing, max_util = result.count, result.governing_index, result.max_utilisation
+        else:
+            loads = np.asarray(member.get('loads', []), dtype=float).reshape(-1, 2)
+            with instrumentation.stage("load_check"):
+                utilisation = envelope.utilisation(loads[:, 0], loads[:, 1])
+            load_count = int(utilisation.size)
+            governing = int(np.argmax(utilisation)) if utilisation.size else None
+            max_util = float(utilisation[governing]) if utilisation.size else 0.0
+        instrumentation.count("loads_checked", load_count)
+
+        row.update({
+            'steel_area_mm2': round(layout.total_area(), 1),
+            'load_count': load_count,
+            'max_utilisation': round(max_util, 4),
+            'governing_load': governing,
+            'passes': max_util <= 1.0,
+            'max_axial_kN': round(float(diagram.axial_force_N.max()) / 1e3, 2),
+            'max_moment_kNm': round(float(diagram.bending_moment_Nmm.max()) / 1e6, 2),
+            'error': '',
+        })
+    except Exception as e:
+        # Bad schedule data (missing keys, nulls, wrong types) fails this row only, never the batch
+        row.update({'passes': False, 'error': f"{type(e).__name__}: {e}"})
+        instrumentation.count("sections_failed")
+
+    instrumentation.count("sections_processed")
+    return row, diagram, utilisation
+
+
+def _init_worker(cache_dir):
+    global _worker_cache
+    _worker_cache = DiagramCache(cache_dir=cache_dir)
+
+
+def _init_pool_worker(cache_dir):
+    # Forked workers inherit the parent's figures; start from zero so drain() ships only their own
+    instrumentation.reset()
+    _init_worker(cache_dir)
+
+
+def _evaluate_chunk(indexed_members: list, steps: int, with_arrays: bool = False) -> tuple[list, dict]:
+    """Returns the chunk's (index, row, arrays) tuples and this worker's timers and counters."""
+    results = []
+    for i, member in indexed_members:
+        row, diagram, utilisation = _evaluate(member, steps, _worker_cache)
+        results.append((i, row, (diagram, utilisation) if with_arrays else None))
+    return results, instrumentation.drain()
+
+
+def _stream(writer, render_pool, render_dir, row: dict, arrays):
+    """Hands one member's arrays to the stream writer and render pool, then drops them."""
+    if arrays is None or row['error'] or arrays[0] is None:
+        return
+    diagram, utilisation = arrays
+
+    if writer is not None:
+        writer.write_diagram(row['id'], diagram)
+        if utilisation is not None:
+            writer.write_checks(row['id'], utilisation)
+
+    if render_pool is not None:
+        render_pool.submit(
+            diagram,
+            save_path=os.path.join(render_dir, f"{row['id']}.png"),
+            title=f"{row['id']} | {row['width_mm']}×{row['depth_mm']} mm"
+        )
+
+
+def _collect(chunk_output: tuple, results: list, writer, render_pool, render_dir):
+    """Stores one finished chunk's rows, merges its worker figures and streams its arrays."""
+    chunk_results, stats = chunk_output
+    instrumentation.merge(stats)
+    for i, row, arrays in chunk_results:
+        results[i] = row
+        _stream(writer, render_pool, render_dir, row, arrays)
+
+
+def _sort_key(member: dict) -> str:
+    """Groups identical column types into the same chunk for cache reuse."""
+    try:
+        return diagram_key(*build_member(member), 0)
+    except Exception:
+        return ''   # invalid entries sort together; _evaluate records their error
+
+
+def run_batch(
+    members: list[dict],
+    workers: int = None,
+    chunk_size: int = 50,
+    steps: int = 200,
+    cache_dir: str = None,
+    writer=None,
+    render_pool=None,
+    render_dir: str = "exports"
+) -> list[dict]:
+    """
+    Evaluates a whole schedule across a process pool.
+
+    Members are sorted by section type, split into chunks and farmed out to
+    worker processes; each worker keeps its own diagram cache between chunks.
+    At most two chunks per worker are in flight, and each finished chunk is
+    streamed and dropped, so peak memory does not grow with the schedule.
+
+    Parameters:
+        members (list[dict]): Schedule entries (see load_schedule)
+        workers (int, optional): Process count (default: CPU count; 1 runs in-process)
+        chunk_size (int): Members per task
+        steps (int): Neutral-axis steps per diagram
+        cache_dir (str, optional): Shared on-disk diagram cache
+        writer (DiagramStreamWriter, optional): Receives each member's diagram
+            and utilisations as soon as its chunk finishes
+        render_pool (RenderPool, optional): Renders each member's PNG in the
+            background while later chunks are still computing
+        render_dir (str): Folder for rendered PNGs
+
+    Returns:
+        list[dict]: Result rows in schedule order
+    """
+    indexed = sorted(enumerate(members), key=lambda item: _sort_key(item[1]))
+    chunks = [indexed[i:i + chunk_size] for i in range(0, len(indexed), chunk_size)]
+    results = [None] * len(members)
+    with_arrays = writer is not None or render_pool is not None
+
+    if workers == 1:
+        _init_worker(cache_dir)
+        for chunk in chunks:
+            _collect(_evaluate_chunk(chunk, steps, with_arrays), results, writer, render_pool, render_dir)
+        return results
+
+    max_in_flight = 2 * (workers or os.cpu_count() or 1)
+    remaining = iter(chunks)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_pool_worker, initargs=(cache_dir,)) as pool:
+        in_flight = set()
+        while True:
+            for chunk in remaining:
+                in_flight.add(pool.submit(_evaluate_chunk, chunk, steps, with_arrays))
+                if len(in_flight) >= max_in_flight:
+                    break
+            if not in_flight:
+                break
+
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            while done:
+                # A finished future holds its chunk's arrays, so it is dropped as soon as it is consumed
+                _collect(done.pop().result(), results, writer, render_pool, render_dir)
+
+    return results
+
+
+def write_results(rows: list[dict], path: str):
+    """Writes result rows as one CSV table."""
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+
+    with open(path, 'w', newline='') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=RESULT_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def run_batch_cli():
+    """Entry point: schedule in, results table out."""
+    from cli import parse_batch_args
+
+    args = parse_batch_args()
+    if args['profile']:
+        instrumentation.start_profiler()
+
+    with instrumentation.stage("load_schedule"):
+        members = load_schedule(args['schedule'])
+
+    writer = None
+    if args['export_format']:
+        writer = DiagramStreamWriter(
+            out_dir=os.path.dirname(args['out']) or '.',
+            fmt=args['export_format'],
+            name='batch'
+        )
+
+    render_pool = None
+    if args['render_dir']:
+        from interaction_plot import RenderPool
+
+        os.makedirs(args['render_dir'], exist_ok=True)
+        render_pool = RenderPool()
+
+    try:
+        with instrumentation.stage("run_batch"):
+            rows = run_batch(
+                members,
+                workers=args['workers'],
+                chunk_size=args['chunk_size'],
+                steps=args['steps'],
+                cache_dir=args['cache_dir'],
+                writer=writer,
+                render_pool=render_pool,
+                render_dir=args['render_dir']
+            )
+    finally:
+        if writer is not None:
+            writer.close()
+        if render_pool is not None:
+            render_pool.close()
+
+    with instrumentation.stage("write_results"):
+        write_results(rows, args['out'])
+
+    failed = sum(1 for row in rows if not row['passes'])
+    print(f"✅ {len(rows)} members checked, {failed} failing → {args['out']}")
+
+    if args['profile']:
+        # cProfile only sees this process; use --workers 1 to profile the solver itself
+        instrumentation.stop_profiler()
+        report_path = os.path.join(os.path.dirname(args['out']) or '.', 'batch_profile.json')
+        instrumentation.save_report(report_path, workers=args['workers'], members=len(members))
+        print(f"⏱️  Profile report saved to {report_path}")
+
+
+if __name__ == "__main__":
+    run_batch_cli()
@@ -0,0 +1,290 @@
+# biaxial.py
+
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from section_solver import E_S, EPS_CU, ALPHA_CC, LAMBDA, neutral_axis_sweep
+from steel_stress import steel_stress_array
+
+# Bar positions relative to the section centroid: y across the width, z up the depth
+BarArrays = namedtuple("BarArrays", ["y_mm", "z_mm", "area_mm2"])
+
+
+def bars_from_layout(layout, section, edge_mm: float = 50.0) -> BarArrays:
+    """
+    Spreads every RebarGroup evenly across the width at its depth.
+
+    Parameters:
+        layout (RebarLayout): Reinforcement layout (depths from top fiber)
+        section (Section): Rectangular section
+        edge_mm (float): Distance from the side faces to the outer bar centres
+
+    Returns:
+        BarArrays: One entry per bar
+    """
+    y, z, area = [], [], []
+    half_span = section.width_mm / 2 - edge_mm
+    for group in layout:
+        single = group.area_mm2 / group.count
+        y.extend(np.linspace(-half_span, half_span, group.count) if group.count > 1 else [0.0])
+        z.extend([section.depth_mm / 2 - group.depth_mm] * group.count)
+        area.extend([single] * group.count)
+    return BarArrays(np.array(y, dtype=float), np.array(z, dtype=float), np.array(area, dtype=float))
+
+
+def perimeter_bars(section, diameter_mm: float, n_width: int, n_depth: int, cover_mm: float) -> BarArrays:
+    """
+    Column-style layout: n_width bars on the top and bottom faces and
+    n_depth bars on each side face (corners counted once).
+
+    Parameters:
+        section (Section): Rectangular section
+        diameter_mm (float): Bar diameter (mm)
+        n_width (int): Bars along each horizontal face (>= 2)
+        n_depth (int): Bars along each vertical face (>= 2)
+        cover_mm (float): Cover to bar surface (mm)
+
+    Returns:
+        BarArrays: One entry per bar
+    """
+    a = section.width_mm / 2 - cover_mm - diameter_mm / 2
+    b = section.depth_mm / 2 - cover_mm - diameter_mm / 2
+
+    ys = np.linspace(-a, a, n_width)
+    zs = np.linspace(-b, b, n_depth)[1:-1]
+
+    y = np.concatenate([ys, ys, np.full(zs.size, -a), np.full(zs.size, a)])
+    z = np.concatenate([np.full(n_width, b), np.full(n_width, -b), zs, zs])
+    area = np.full(y.size, np.pi * diameter_mm ** 2 / 4)
+    return BarArrays(y, z, area)
+
+
+def _concrete_fibers(width_mm: float, depth_mm: float, n_fibers: int):
+    """Regular n_fibers × n_fibers grid over the rectangle."""
+    dy, dz = width_mm / n_fibers, depth_mm / n_fibers
+    y = -width_mm / 2 + dy * (np.arange(n_fibers) + 0.5)
+    z = -depth_mm / 2 + dz * (np.arange(n_fibers) + 0.5)
+    Y, Z = np.meshgrid(y, z)
+    return Y.ravel(), Z.ravel(), np.full(Y.size, dy * dz)
+
+
+def _meridian(theta, width_mm, depth_mm, f_cd, f_yd, bars, steps, n_fibers, eps_cu):
+    """
+    N, My, Mz along one neutral-axis angle.
+
+    theta is the direction of the compression side in the (y, z) plane;
+    x follows section_solver.neutral_axis_sweep over the depth D normal to
+    the axis: uniform to D/λ, geometric out to FAR_DEPTH_RATIO·D, then inf
+    (squash), so the bars' approach to compression yield is sampled.
+    """
+    u = np.array([np.cos(theta), np.sin(theta)])
+
+    fy, fz, fa = _concrete_fibers(width_mm, depth_mm, n_fibers)
+    corners = np.array([[-1, -1], [-1, 1], [1, -1], [1, 1]]) * [width_mm / 2, depth_mm / 2]
+    top = (corners @ u).max()
+    D = top - (corners @ u).min()
+
+    x = neutral_axis_sweep(D, steps)
+
+    # Concrete: fibres within λx of the extreme compression fibre carry α·fcd
+    t_fiber = top - (fy * u[0] + fz * u[1])
+    in_block = t_fiber[None, :] <= LAMBDA * x[:, None]
+    concrete = in_block.astype(float) @ (ALPHA_CC * f_cd * fa[:, None] * np.column_stack([np.ones_like(fy), fz, fy]))
+
+    # Steel: strain compatibility, one (n_x × n_bars) broadcast
+    t_bar = top - (bars.y_mm * u[0] + bars.z_mm * u[1])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        strain = eps_cu * (1.0 - t_bar[None, :] / x[:, None])
+    stress = steel_stress_array(strain, f_yd, f_yd / E_S)
+    steel = (stress * bars.area_mm2[None, :]) @ np.column_stack([np.ones_like(bars.y_mm), bars.z_mm, bars.y_mm])
+
+    total = concrete + steel
+    return total[:, 0], total[:, 1], total[:, 2]
+
+
+def _meridian_job(args):
+    return _meridian(*args)
+
+
+class InteractionSurface:
+    """
+    Biaxial N–My–Mz interaction surface stored as a (n_angles × n_points) mesh.
+
+    For fast checks the mesh is resampled once onto a regular grid of
+    axial-force levels × moment directions holding the moment capacity
+    radius, so each load is answered by a bilinear lookup.
+
+    Parameters:
+        angles (np.ndarray): Neutral-axis angles of the meridians (rad)
+        N, My, Mz (np.ndarray): Mesh arrays of shape (n_angles, n_points)
+        n_levels (int): Axial-force levels in the lookup grid
+        n_phi (int): Moment directions in the lookup grid
+
+    Methods:
+        utilisation(N, My, Mz): |M| / M_Rd at constant N, in the load's moment direction
+    """
+
+    def __init__(self, angles, N, My, Mz, n_levels: int = 64, n_phi: int = 180):
+        self.angles = np.asarray(angles, dtype=float)
+        self.N = np.asarray(N, dtype=float)
+        self.My = np.asarray(My, dtype=float)
+        self.Mz = np.asarray(Mz, dtype=float)
+
+        self.N_min = float(self.N.min(axis=1).max())
+        self.N_max = float(self.N.max(axis=1).min())
+        self._build_lookup(n_levels, n_phi)
+
+    def _build_lookup(self, n_levels: int, n_phi: int):
+        levels = np.linspace(self.N_min, self.N_max, n_levels)
+        phi = np.linspace(-np.pi, np.pi, n_phi + 1)
+
+        # Moment contour of every meridian at every level: (n_levels, n_angles)
+        order = np.argsort(self.N, axis=1, kind="stable")
+        N_sorted = np.take_along_axis(self.N, order, axis=1)
+        My_sorted = np.take_along_axis(self.My, order, axis=1)
+        Mz_sorted = np.take_along_axis(self.Mz, order, axis=1)
+        cy = np.array([np.interp(levels, n, m) for n, m in zip(N_sorted, My_sorted)]).T
+        cz = np.array([np.interp(levels, n, m) for n, m in zip(N_sorted, Mz_sorted)]).T
+
+        radius = np.zeros((n_levels, phi.size))
+        for k in range(n_levels):
+            radius[k] = _contour_radius(cy[k], cz[k], phi)
+
+        self._levels = levels
+        self._phi = phi
+        self._radius = radius
+
+    def moment_capacity(self, N, direction):
+        """
+        Moment capacity radius at axial force N in moment direction atan2(Mz, My).
+
+        Parameters:
+            N (float or array-like): Axial force (N)
+            direction (float or array-like): Moment direction (rad)
+
+        Returns:
+            np.ndarray: |M_Rd| (N·mm); 0 outside [N_min, N_max]
+        """
+        N = np.asarray(N, dtype=float)
+        direction = np.asarray(direction, dtype=float)
+
+        fl = (N - self._levels[0]) / (self._levels[1] - self._levels[0])
+        fp = (direction - self._phi[0]) / (self._phi[1] - self._phi[0])
+
+        il = np.clip(np.floor(fl).astype(int), 0, self._levels.size - 2)
+        ip = np.clip(np.floor(fp).astype(int), 0, self._phi.size - 2)
+        wl = np.clip(fl - il, 0.0, 1.0)
+        wp = np.clip(fp - ip, 0.0, 1.0)
+
+        R = self._radius
+        capacity = (
+            (1 - wl) * (1 - wp) * R[il, ip] + (1 - wl) * wp * R[il, ip + 1]
+            + wl * (1 - wp) * R[il + 1, ip] + wl * wp * R[il + 1, ip + 1]
+        )
+        return np.where((N >= self.N_min) & (N <= self.N_max), capacity, 0.0)
+
+    def utilisation(self, N, My, Mz):
+        """
+        Biaxial utilisation at constant axial force.
+
+        Parameters:
+            N (array-like): Applied axial force (N), compression positive
+            My (array-like): Applied moment about y (N·mm)
+            Mz (array-like): Applied moment about z (N·mm)
+
+        Returns:
+            np.ndarray: |M| / M_Rd(N, direction); inf when N is outside the surface
+        """
+        My = np.asarray(My, dtype=float)
+        Mz = np.asarray(Mz, dtype=float)
+        moment = np.hypot(My, Mz)
+        capacity = self.moment_capacity(N, np.arctan2(Mz, My))
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratio = np.where(capacity > 0, moment / capacity, np.inf)
+        return np.where(moment == 0, np.where(capacity > 0, 0.0, ratio), ratio)
+
+    def to_npz(self, path: str):
+        """Stores the mesh (not the lookup grid) compactly."""
+        np.savez_compressed(path, angles=self.angles, N=self.N, My=self.My, Mz=self.Mz)
+
+    @classmethod
+    def from_npz(cls, path: str, **kwargs) -> "InteractionSurface":
+        with np.load(path) as data:
+            return cls(data["angles"], data["N"], data["My"], data["Mz"], **kwargs)
+
+
+def _contour_radius(cy: np.ndarray, cz: np.ndarray, phi: np.ndarray) -> np.ndarray:
+    """Radius of a closed (My, Mz) contour along each direction in phi."""
+    theta = np.arctan2(cz, cy)
+    order = np.argsort(theta, kind="stable")
+    theta, cy, cz = theta[order], cy[order], cz[order]
+
+    ny, nz = np.roll(cy, -1), np.roll(cz, -1)
+    a = nz - cz
+    b = cy - ny
+    c = a * cy + b * cz
+
+    k = np.searchsorted(theta, phi, side="right") - 1
+    with np.errstate(divide='ignore', invalid='ignore'):
+        r = c[k] / (a[k] * np.cos(phi) + b[k] * np.sin(phi))
+    return np.where(np.isfinite(r) & (r > 0), r, 0.0)
+
+
+def generate_interaction_surface(
+    section,
+    material,
+    bars: BarArrays,
+    n_angles: int = 36,
+    steps: int = 100,
+    n_fibers: int = 40,
+    workers: int = None,
+    eps_cu: float = EPS_CU
+) -> InteractionSurface:
+    """
+    Sweeps neutral-axis angle and depth for a rectangular section.
+
+    Every angle meridian is independent and is computed in its own
+    process task; workers=1 runs them in-process.
+
+    Parameters:
+        section (Section): Rectangular section
+        material (Material): Material with fcd and fyd
+        bars (BarArrays): Bar positions and areas
+        n_angles (int): Meridians over 0 … 2π
+        steps (int): Neutral-axis steps per meridian
+        n_fibers (int): Concrete grid resolution per side
+        workers (int, optional): Process count (default: CPU count)
+        eps_cu (float): Ultimate concrete strain
+
+    Returns:
+        InteractionSurface: Mesh plus lookup grid for biaxial checks
+    """
+    angles = 2 * np.pi * np.arange(n_angles) / n_angles
+    jobs = [
+        (theta, section.width_mm, section.depth_mm, material.fcd, material.fyd, bars, steps, n_fibers, eps_cu)
+        for theta in angles
+    ]
+
+    if workers == 1:
+        meridians = [_meridian_job(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            meridians = list(pool.map(_meridian_job, jobs))
+
+    N, My, Mz = (np.array(component) for component in zip(*meridians))
+    return InteractionSurface(angles, N, My, Mz)
+
+
+# Optional test block
+if __name__ == "__main__":
+    from materials import Material
+    from section import Section
+
+    material = Material(name="C30", fck=30, fyk=500)
+    section = Section(width_mm=400, depth_mm=400)
+    bars = perimeter_bars(section, diameter_mm=20, n_width=3, n_depth=3, cover_mm=30)
+
+    surface = generate_interaction_surface(section, material, bars)
+    print(f"Mesh: {surface.N.shape[0]} meridians × {surface.N.shape[1]} points")
+    print(f"Utilisation (1000 kN, 100 kNm, 100 kNm): {surface.utilisation(1e6, 1e8, 1e8):.3f}")
@@ -17,11 +17,15 @@ def parse_cli_args() -> dict:
     parser.add_argument('--fyk', type=float, required=True,
                         help='Characteristic steel strength fyk (MPa)')
     parser.add_argument("--save_diagram", action="store_true", help="Save plot as PNG")
+    parser.add_argument("--no_show", action="store_true",
+                        help="Headless run: skip the interactive plot window")
     parser.add_argument(
         "--save_summary",
         action="store_true",
         help="Save material and geometry summary"
     )
+    parser.add_argument("--profile", action="store_true",
+                        help="Profile the run and write a JSON timing report to exports/")
 
     args = parser.parse_args()
 
@@ -36,4 +40,110 @@ def parse_cli_args() -> dict:
         'code': code_enum,
         'save_diagram': args.save_diagram,
         'save_summary': args.save_summary,
+        'no_show': args.no_show,
+        'profile': args.profile,
+    }
+
+
+def parse_batch_args() -> dict:
+    parser = argparse.ArgumentParser(description="RC Section Designer batch runner")
+
+    parser.add_argument('schedule', help='JSON schedule of members, rebar layouts and load combinations')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Worker processes (default: one per CPU core)')
+    parser.add_argument('--chunk_size', type=int, default=50,
+                        help='Members per worker task (default: 50)')
+    parser.add_argument('--steps', type=int, default=200,
+                        help='Neutral-axis steps per diagram (default: 200)')
+    parser.add_argument('--cache_dir', default=None,
+                        help='Optional on-disk diagram cache folder (e.g. exports/cache)')
+    parser.add_argument('--out', default='exports/batch_results.csv',
+                        help='Results table path (default: exports/batch_results.csv)')
+    parser.add_argument('--export_format', choices=['npy', 'csv'], default=None,
+                        help='Stream every diagram and load check next to the results table')
+    parser.add_argument('--render_dir', default=None,
+                        help='Render one PNG per member into this folder in a background pool')
+    parser.add_argument('--profile', action='store_true',
+                        help='Profile the run and write a JSON timing report next to the results table')
+
+    args = parser.parse_args()
+
+    return {
+        'schedule': args.schedule,
+        'workers': args.workers,
+        'chunk_size': args.chunk_size,
+        'steps': args.steps,
+        'cache_dir': args.cache_dir,
+        'out': args.out,
+        'export_format': args.export_format,
+        'render_dir': args.render_dir,
+        'profile': args.profile,
+    }
+
+
+def parse_grid(text: str) -> list[float]:
+    """Parses 'start:stop:step' (stop inclusive) or a comma-separated list."""
+    if ':' in text:
+        start, stop, step = (float(v) for v in text.split(':'))
+        count = int(round((stop - start) / step)) + 1
+        return [start + i * step for i in range(count)]
+    return [float(v) for v in text.split(',')]
+
+
+def parse_sweep_args() -> dict:
+    parser = argparse.ArgumentParser(description="RC Section Designer parameter sweep")
+
+    parser.add_argument('--code', type=lambda s:s.upper(), default='EUROCODE', choices=['EUROCODE', 'ACI'],
+                        help='Design code to apply (default: EUROCODE)')
+    parser.add_argument('--width_mm', type=parse_grid, required=True,
+                        help="Widths in mm, e.g. '200:800:50' or '300,400'")
+    parser.add_argument('--depth_mm', type=parse_grid, required=True,
+                        help="Depths in mm, e.g. '300:1000:50'")
+    parser.add_argument('--fck', type=parse_grid, required=True,
+                        help="Concrete strengths fck in MPa, e.g. '20,25,30,35,40'")
+    parser.add_argument('--fyk', type=parse_grid, required=True,
+                        help="Steel strengths fyk in MPa, e.g. '400,500'")
+    parser.add_argument('--rho', type=parse_grid, default=[0.01],
+                        help='Total reinforcement ratios As/(b·h), split equally top and bottom (default: 0.01)')
+    parser.add_argument('--cover_ratio', type=float, default=0.1,
+                        help="Bar centre distance from each face as a fraction of h (default: 0.1)")
+    parser.add_argument('--steps', type=int, default=200,
+                        help='Neutral-axis steps per combination (default: 200)')
+    parser.add_argument('--out', default='exports/capacity_table.npz',
+                        help="Output path, .npz or .csv (default: exports/capacity_table.npz)")
+
+    args = parser.parse_args()
+
+    return {
+        'code': DesignCode[args.code],
+        'width_mm': args.width_mm,
+        'depth_mm': args.depth_mm,
+        'fck': args.fck,
+        'fyk': args.fyk,
+        'rho': args.rho,
+        'cover_ratio': args.cover_ratio,
+        'steps': args.steps,
+        'out': args.out,
+    }
+
+
+def parse_service_args() -> dict:
+    parser = argparse.ArgumentParser(description="RC Section Designer service (JSON lines)")
+
+    parser.add_argument('--socket', default=None,
+                        help='UNIX socket path to listen on (default: serve stdin/stdout)')
+    parser.add_argument('--steps', type=int, default=200,
+                        help='Neutral-axis steps per diagram (default: 200)')
+    parser.add_argument('--max_entries', type=int, default=1024,
+                        help='Envelopes kept warm in memory (default: 1024)')
+    parser.add_argument('--cache_dir', default=None,
+                        help='Optional on-disk diagram cache folder (e.g. exports/cache)')
+
+    args = parser.parse_args()
+
+    return {
+        'socket': args.socket,
+        'steps': args.steps,
+        'max_entries': args.max_entries,
+        'cache_dir': args.cache_dir,
     }
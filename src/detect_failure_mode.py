@@ -1,6 +1,7 @@
 # detect_failure_mode.py
 
 from enum import Enum
+import numpy as np
 
 class FailureMode(Enum):
     COMPRESSION_CONTROLLED = 'Compression-Controlled'
@@ -37,4 +38,105 @@ def detect_failure_mode(
     elif strain_top >= eps_cu and strain_bottom >= eps_su:
         return FailureMode.BALANCED
     else:
-        return FailureMode.NO_FAILURE
\ No newline at end of file
+        return FailureMode.NO_FAILURE
+
+
+# Integer codes used by detect_failure_modes(); index into MODE_CODES to decode
+MODE_CODES = (
+    FailureMode.COMPRESSION_CONTROLLED,
+    FailureMode.TENSION_CONTROLLED,
+    FailureMode.BALANCED,
+    FailureMode.NO_FAILURE,
+)
+
+# Short labels per code, as used by plotting colours and CSV export
+MODE_KEYS = ("compression", "tension", "balanced", "other")
+
+# Design yield strain of B500 steel, fyd / Es = (500 / 1.15) / 200 000
+EPS_Y = 500 / 1.15 / 200000
+
+# (crushed + 2·yielded) → code: steel yielding decides the mode, whether or
+# not the concrete has also reached εcu (EC2/ACI ductility classification)
+_CODE_TABLE = np.array([3, 0, 1, 1], dtype=np.int8)
+
+
+def detect_failure_modes(strain_top, strain_steel, eps_cu: float = 0.0035, eps_y: float = EPS_Y) -> np.ndarray:
+    """
+    Array classification of ultimate strain states by the tension steel.
+
+    A state is tension-controlled once the tension steel has yielded,
+    compression-controlled when the concrete crushes first, and balanced
+    when both happen together. The boundary is therefore exactly
+    balanced_neutral_axis(d, f_yd) for strains from ultimate_strains(x, d).
+
+    Parameters:
+        strain_top (array-like): Top fiber strains (positive = compression)
+        strain_steel (array-like): Tension steel strains (positive = tension)
+        eps_cu (float): Ultimate concrete strain (default: EC2 0.0035)
+        eps_y (float): Design yield strain fyd / Es of the steel
+
+    Returns:
+        np.ndarray: int8 codes, one per state; decode with decode_failure_modes()
+    """
+    strain_top = np.asarray(strain_top, dtype=float)
+    strain_steel = np.asarray(strain_steel, dtype=float)
+    crushed = strain_top >= eps_cu * (1 - 1e-9)
+    yielded = strain_steel >= eps_y
+    codes = _CODE_TABLE[crushed.astype(np.intp) + 2 * yielded.astype(np.intp)]
+    balanced = crushed & np.isclose(strain_steel, eps_y, rtol=1e-9, atol=0.0)
+    return np.where(balanced, np.int8(2), codes)
+
+
+def decode_failure_modes(codes) -> list[FailureMode]:
+    """Turns an int code array back into FailureMode members."""
+    return [MODE_CODES[c] for c in np.asarray(codes).ravel().tolist()]
+
+
+def ultimate_strains(
+    x,
+    effective_depth_mm: float,
+    eps_cu: float = 0.0035,
+    eps_su: float = 0.010
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Top fiber and tension steel strains at ultimate, following the EC2 pivots.
+
+    Above x_lim = εcu·d / (εcu + εsu) the top fiber sits at eps_cu (pivot B).
+    Below it the steel would pass eps_su first, so the strain plane turns
+    about the steel instead (pivot A): steel = eps_su and
+    top = eps_su·x / (d − x), short of crushing.
+
+    Parameters:
+        x (array-like): Neutral axis depths (mm)
+        effective_depth_mm (float): Depth d of the tension steel (mm)
+        eps_cu (float): Ultimate concrete strain
+        eps_su (float): Ultimate steel strain
+
+    Returns:
+        tuple: (strain_top, strain_steel), steel positive in tension
+    """
+    x = np.asarray(x, dtype=float)
+    d = effective_depth_mm
+    pivot_a = x < eps_cu * d / (eps_cu + eps_su)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        top = np.where(pivot_a, eps_su * x / (d - x), eps_cu)
+        steel = np.where(pivot_a, eps_su, eps_cu * (d - x) / x)
+    return top, steel
+
+
+def balanced_neutral_axis(effective_depth_mm, f_yd: float, eps_cu: float = 0.0035, E_s: float = 200000):
+    """
+    Exact balanced-point depth x_b = εcu·d / (εcu + fyd/Es), at which the
+    tension steel at depth d yields as the top fiber crushes: the boundary
+    between tension- and compression-controlled in detect_failure_modes.
+
+    Parameters:
+        effective_depth_mm (float or array-like): Depth d of the tension steel, one or many sections (mm)
+        f_yd (float): Design yield strength of steel (MPa)
+        eps_cu (float): Ultimate concrete strain
+        E_s (float): Elastic modulus of steel (MPa)
+
+    Returns:
+        float or np.ndarray: Balanced neutral axis depth(s) (mm)
+    """
+    return eps_cu * np.asarray(effective_depth_mm, dtype=float) / (eps_cu + f_yd / E_s)
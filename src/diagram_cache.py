@@ -0,0 +1,172 @@
+# diagram_cache.py
+
+import hashlib
+import json
+import os
+from collections import OrderedDict
+import numpy as np
+from interaction_diagram import InteractionArrays
+from incremental import incremental_section_diagram
+from section_solver import hogging_branch
+from instrumentation import default_instrumentation as instrumentation
+
+# Part of every key; bump when the solver's x sweep changes so stale disk entries are ignored
+DIAGRAM_VERSION = 2
+
+
+def diagram_key(section, material, layout, steps: int) -> str:
+    """
+    Content hash of everything that determines a section diagram.
+
+    The material name is left out and rebar groups are sorted, so equal
+    column types share one entry regardless of labels or input order.
+
+    Parameters:
+        section (Section): Section geometry
+        material (Material): Material incl. design code
+        layout (RebarLayout): Reinforcement layout
+        steps (int): Number of x-depth steps
+
+    Returns:
+        str: Hex SHA-256 digest
+    """
+    material_data = material.to_dict()
+    material_data.pop('name', None)
+
+    groups = sorted(
+        (g['diameter'], g['count'], float(g['depth'])) for g in layout.to_dict()['groups']
+    )
+
+    payload = {
+        'section': section.to_dict(),
+        'material': material_data,
+        'rebar': groups,
+        'steps': steps,
+        'version': DIAGRAM_VERSION,
+    }
+    blob = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+class DiagramCache:
+    """
+    LRU cache of section diagrams, with an optional on-disk store.
+
+    Parameters:
+        max_entries (int): In-memory capacity before least recently used entries are evicted
+        cache_dir (str, optional): Folder for .npz copies (e.g. 'exports/cache')
+
+    Attributes:
+        hits (int): Lookups answered from memory or disk
+        misses (int): Lookups that had to compute the diagram
+    """
+
+    def __init__(self, max_entries: int = 256, cache_dir: str = None):
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def get_or_compute(self, section, material, layout, steps: int = 200) -> InteractionArrays:
+        """
+        Returns the section diagram, computing it only on a cache miss.
+
+        Parameters:
+            section (Section): Section geometry
+            material (Material): Material incl. design code
+            layout (RebarLayout): Reinforcement layout
+            steps (int): Number of x-depth steps
+
+        Returns:
+            InteractionArrays: Section diagram (as generate_section_diagram), assembled by incremental_section_diagram
+        """
+        key = diagram_key(section, material, layout, steps)
+
+        diagram = self._entries.get(key)
+        if diagram is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            instrumentation.count("cache_hits")
+            return diagram
+
+        diagram = self._load(key)
+        if diagram is not None:
+            self.hits += 1
+            instrumentation.count("cache_hits")
+        else:
+            self.misses += 1
+            instrumentation.count("cache_misses")
+            with instrumentation.stage("diagram"):
+                diagram = incremental_section_diagram(section, material, layout, steps)
+            instrumentation.count("points_evaluated", diagram.neutral_axis_mm.size)
+            self._store(key, diagram)
+
+        self._remember(key, diagram)
+        return diagram
+
+    def get_or_compute_hogging(self, section, material, layout, steps: int = 200) -> InteractionArrays:
+        """
+        Negative-moment branch, cached as the flipped section's diagram. A
+        layout symmetric about mid-depth flips onto itself, so its hogging
+        branch is a cache hit.
+
+        Returns:
+            InteractionArrays: As section_solver.hogging_section_diagram
+        """
+        return hogging_branch(self.get_or_compute(section, material, layout.flipped(section.depth_mm), steps))
+
+    def clear(self):
+        """Empties the in-memory store (disk copies are kept)."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remember(self, key: str, diagram: InteractionArrays):
+        self._entries[key] = diagram
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.npz")
+
+    def _load(self, key: str):
+        if not self.cache_dir or not os.path.exists(self._path(key)):
+            return None
+        with np.load(self._path(key)) as data:
+            return InteractionArrays(*(data[field] for field in InteractionArrays._fields))
+
+    def _store(self, key: str, diagram: InteractionArrays):
+        if not self.cache_dir:
+            return
+        # Write then rename so parallel workers never read a half-written file
+        tmp_path = f"{self._path(key)}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(f, **diagram._asdict())
+        os.replace(tmp_path, self._path(key))
+
+
+# Process-wide cache used when callers do not pass their own
+default_cache = DiagramCache()
+
+
+def cached_section_diagram(section, material, layout, steps: int = 200, cache: DiagramCache = None) -> InteractionArrays:
+    """
+    Convenience wrapper around DiagramCache.get_or_compute.
+
+    Parameters:
+        section (Section): Section geometry
+        material (Material): Material incl. design code
+        layout (RebarLayout): Reinforcement layout
+        steps (int): Number of x-depth steps
+        cache (DiagramCache, optional): Defaults to the module-level cache
+
+    Returns:
+        InteractionArrays: Cached or freshly computed diagram
+    """
+    cache = cache if cache is not None else default_cache
+    return cache.get_or_compute(section, material, layout, steps)
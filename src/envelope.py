@@ -0,0 +1,131 @@
+# envelope.py
+
+import numpy as np
+
+
+class InteractionEnvelope:
+    """
+    Precomputed N–M envelope for repeated capacity lookups.
+
+    Built once from an interaction diagram; every query afterwards is a
+    binary search plus one linear interpolation.
+
+    Parameters:
+        diagram: InteractionArrays, or a list of InteractionPoint, ordered
+            along the neutral-axis sweep (M >= 0 branch)
+        hogging (optional): The M <= 0 branch in the same form, e.g. from
+            section_solver.hogging_section_diagram. When omitted the diagram
+            is mirrored about M = 0, which is exact only for reinforcement
+            symmetric about mid-depth.
+
+    Attributes:
+        N_min (float): Lowest axial resistance (N), i.e. pure tension
+        N_max (float): Highest axial resistance (N), i.e. squash load
+
+    Methods:
+        moment_capacity(N): M_Rd at the given axial force(s) (N·mm)
+        utilisation(N, M): Ratio along the ray from the origin through (N, M)
+    """
+
+    def __init__(self, diagram, hogging=None):
+        N, M = self._columns(diagram)
+        if N.size < 2:
+            raise ValueError("Envelope needs at least two diagram points.")
+        hog_N, hog_M = self._columns(hogging) if hogging is not None else (N, -M)
+
+        self._build_capacity_table(N, M)
+        self._build_ray_table(N, M, hog_N, hog_M)
+
+    @staticmethod
+    def _columns(diagram) -> tuple[np.ndarray, np.ndarray]:
+        if hasattr(diagram, "axial_force_N"):
+            return (np.asarray(diagram.axial_force_N, dtype=float),
+                    np.asarray(diagram.bending_moment_Nmm, dtype=float))
+        return (np.array([pt.axial_force_N for pt in diagram], dtype=float),
+                np.array([pt.bending_moment_Nmm for pt in diagram], dtype=float))
+
+    # ---- Build steps ----
+
+    def _build_capacity_table(self, N, M):
+        """Sorts the M >= 0 branch by N and stores per-segment slopes."""
+        order = np.argsort(N, kind="stable")
+        self._N = N[order]
+        self._M = M[order]
+
+        dN = np.diff(self._N)
+        dM = np.diff(self._M)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self._slope = np.where(dN > 0, dM / dN, 0.0)
+
+        self.N_min = float(self._N[0])
+        self.N_max = float(self._N[-1])
+
+    def _build_ray_table(self, N, M, hog_N, hog_M):
+        """
+        Sorts the closed polygon by polar angle and stores each edge as the
+        line a·N + b·M = 1, so the ray utilisation is simply a·N + b·M.
+        """
+        # Sagging branch tension → squash, then hogging branch back to tension
+        poly_N = np.concatenate([N, hog_N[::-1]])
+        poly_M = np.concatenate([M, hog_M[::-1]])
+
+        # Drop repeated vertices (mirror joints, coincident sweep points)
+        keep = (poly_N != np.roll(poly_N, -1)) | (poly_M != np.roll(poly_M, -1))
+        poly_N, poly_M = poly_N[keep], poly_M[keep]
+
+        theta = np.arctan2(poly_M, poly_N)
+        sweep = np.diff(np.unwrap(np.append(theta, theta[0])))
+        if not (np.all(sweep <= 1e-12) or np.all(sweep >= -1e-12)):
+            raise ValueError("Envelope is not star-shaped about the origin.")
+
+        order = np.argsort(theta, kind="stable")
+        theta, poly_N, poly_M = theta[order], poly_N[order], poly_M[order]
+
+        next_N = np.roll(poly_N, -1)
+        next_M = np.roll(poly_M, -1)
+        a = next_M - poly_M
+        b = poly_N - next_N
+        c = a * poly_N + b * poly_M
+        if np.any(c <= 0):
+            raise ValueError("Envelope must strictly enclose the origin (N = 0, M = 0).")
+
+        self._theta = theta
+        self._edge_a = a / c
+        self._edge_b = b / c
+
+    # ---- Queries ----
+
+    def moment_capacity(self, N):
+        """
+        Moment resistance M_Rd at the given axial force(s).
+
+        Parameters:
+            N (float or array-like): Axial force (N), compression positive
+
+        Returns:
+            float or np.ndarray: M_Rd (N·mm); NaN outside [N_min, N_max]
+        """
+        N = np.asarray(N, dtype=float)
+        k = np.clip(np.searchsorted(self._N, N, side="right") - 1, 0, self._slope.size - 1)
+        M_Rd = self._M[k] + self._slope[k] * (N - self._N[k])
+        M_Rd = np.where((N >= self.N_min) & (N <= self.N_max), M_Rd, np.nan)
+        return M_Rd if M_Rd.ndim else float(M_Rd)
+
+    def utilisation(self, N, M):
+        """
+        Utilisation along the ray from the origin through (N, M).
+
+        Parameters:
+            N (float or array-like): Applied axial force (N)
+            M (float or array-like): Applied moment (N·mm)
+
+        Returns:
+            float or np.ndarray: 1.0 on the envelope, < 1.0 inside
+        """
+        N = np.asarray(N, dtype=float)
+        M = np.asarray(M, dtype=float)
+
+        # Edge k spans theta[k] … theta[k + 1]; -1 wraps to the closing edge
+        k = np.searchsorted(self._theta, np.arctan2(M, N), side="right") - 1
+        ratio = self._edge_a[k] * N + self._edge_b[k] * M
+        return ratio if ratio.ndim else float(ratio)
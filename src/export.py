@@ -1,6 +1,20 @@
 # export.py
 
 import csv
+import os
+import struct
+import numpy as np
+from interaction_diagram import InteractionArrays
+
+# Columns of the 'npy' stream index file
+INDEX_FIELDS = ['section_id', 'diagram_offset', 'diagram_rows', 'check_offset', 'check_rows']
+
+# One .npy file per streamed column: <name>_<column>.npy
+DIAGRAM_COLUMNS = list(InteractionArrays._fields)
+CHECK_COLUMN = 'utilisation'
+
+# Fixed .npy header size, so the row count can be rewritten in place on close
+NPY_HEADER_BYTES = 128
 
 def export_interaction_to_csv(data: list, filename: str):
     """
@@ -14,4 +28,178 @@ def export_interaction_to_csv(data: list, filename: str):
         writer = csv.DictWriter(csvfile, fieldnames=['axial_kN', 'moment_kNm', 'failure_mode'])
         writer.writeheader()
         for row in data:
-            writer.writerow(row)
\ No newline at end of file
+            writer.writerow(row)
+
+class DiagramStreamWriter:
+    """
+    Streams diagram arrays and load-check results to disk section by section.
+
+    Nothing is buffered beyond the section being written, so peak memory
+    does not grow with the number of sections.
+
+    Formats:
+        'npy': One 1-D float64 .npy file per column, appended in place:
+               <name>_neutral_axis_mm.npy, <name>_axial_force_N.npy,
+               <name>_bending_moment_Nmm.npy and <name>_utilisation.npy,
+               plus <name>_index.csv with row offsets. The headers get their
+               final row counts on close(), so np.load(..., mmap_mode='r')
+               opens them directly; see read_diagram_stream().
+        'csv': <name>_diagrams.csv and <name>_checks.csv, written in one
+               np.savetxt block per section.
+
+    Parameters:
+        out_dir (str): Output folder (default: 'exports')
+        fmt (str): 'npy' or 'csv'
+        name (str): File name prefix
+    """
+
+    def __init__(self, out_dir: str = "exports", fmt: str = "npy", name: str = "stream"):
+        if fmt not in ("npy", "csv"):
+            raise ValueError(f"Unknown stream format: {fmt}")
+
+        os.makedirs(out_dir, exist_ok=True)
+        self.fmt = fmt
+        self._diagram_rows = 0
+        self._check_rows = 0
+        self._pending = {}
+
+        base = os.path.join(out_dir, name)
+        if fmt == "npy":
+            self._columns = {column: _open_npy_column(f"{base}_{column}.npy") for column in DIAGRAM_COLUMNS}
+            self._diagrams = None
+            self._checks = _open_npy_column(f"{base}_{CHECK_COLUMN}.npy")
+            self._index = open(f"{base}_index.csv", "w", newline="")
+            self._index_writer = csv.writer(self._index)
+            self._index_writer.writerow(INDEX_FIELDS)
+        else:
+            self._diagrams = open(f"{base}_diagrams.csv", "w", newline="")
+            self._checks = open(f"{base}_checks.csv", "w", newline="")
+            self._diagrams.write("section_id,neutral_axis_mm,axial_kN,moment_kNm\n")
+            self._checks.write("section_id,load_index,utilisation,is_safe\n")
+            self._columns = {}
+            self._index = None
+
+    def write_diagram(self, section_id, diagram):
+        """
+        Appends one section's diagram.
+
+        Parameters:
+            section_id: Member label
+            diagram (InteractionArrays): Columnar diagram (mm, N, N·mm)
+        """
+        if self.fmt == "npy":
+            rows = 0
+            for column, f in self._columns.items():
+                values = np.asarray(getattr(diagram, column), dtype="<f8")
+                values.tofile(f)
+                f.flush()
+                rows = values.size
+            self._pending[section_id] = (self._diagram_rows, rows)
+            self._diagram_rows += rows
+            return
+
+        block = np.column_stack([
+            np.asarray(diagram.neutral_axis_mm, dtype=float),
+            np.asarray(diagram.axial_force_N, dtype=float) / 1e3,       # kN
+            np.asarray(diagram.bending_moment_Nmm, dtype=float) / 1e6,  # kNm
+        ])
+        np.savetxt(self._diagrams, block, fmt=f"{_csv_label(section_id)},%.6g,%.6g,%.6g")
+        self._diagrams.flush()
+
+    def write_checks(self, section_id, utilisation):
+        """
+        Appends one section's load-check utilisations.
+
+        Parameters:
+            section_id: Member label (write_diagram first for the 'npy' index)
+            utilisation (array-like): Utilisation ratio per load combination
+        """
+        utilisation = np.asarray(utilisation, dtype="<f8").ravel()
+
+        if self.fmt == "npy":
+            utilisation.tofile(self._checks)
+            diagram_offset, diagram_rows = self._pending.pop(section_id, (0, 0))
+            self._index_writer.writerow([
+                section_id, diagram_offset, diagram_rows, self._check_rows, utilisation.size
+            ])
+            self._index.flush()
+            self._check_rows += utilisation.size
+        else:
+            block = np.column_stack([
+                np.arange(utilisation.size), utilisation, utilisation <= 1.0
+            ])
+            np.savetxt(self._checks, block, fmt=f"{_csv_label(section_id)},%d,%.6g,%d")
+        self._checks.flush()
+
+    def close(self):
+        # Sections written without checks still need their index row
+        for section_id in list(self._pending):
+            self.write_checks(section_id, [])
+        if self.fmt == "npy":
+            for f in self._columns.values():
+                _finish_npy_column(f, self._diagram_rows)
+            _finish_npy_column(self._checks, self._check_rows)
+            self._checks = None
+        for f in (self._diagrams, self._checks, self._index):
+            if f is not None:
+                f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def _csv_label(section_id) -> str:
+    """Escapes a label for use inside an np.savetxt format string."""
+    return str(section_id).replace("%", "%%").replace(",", ";")
+
+
+def _npy_header(rows: int) -> bytes:
+    """Version 1.0 header of a 1-D little-endian float64 array, padded to NPY_HEADER_BYTES."""
+    text = f"{{'descr': '<f8', 'fortran_order': False, 'shape': ({rows},), }}"
+    text = text.ljust(NPY_HEADER_BYTES - 10 - 1) + "\n"
+    return b"\x93NUMPY\x01\x00" + struct.pack("<H", len(text)) + text.encode("latin1")
+
+
+def _open_npy_column(path: str):
+    f = open(path, "wb")
+    f.write(_npy_header(0))
+    return f
+
+
+def _finish_npy_column(f, rows: int):
+    """Rewrites the header with the final row count and closes the file."""
+    f.seek(0)
+    f.write(_npy_header(rows))
+    f.close()
+
+
+def read_diagram_stream(out_dir: str = "exports", name: str = "stream") -> tuple:
+    """
+    Opens an 'npy' stream written by DiagramStreamWriter without loading it.
+
+    Returns:
+        tuple: (index rows as list of dicts,
+                InteractionArrays of memory-mapped diagram columns,
+                memory-mapped utilisation column)
+    """
+    base = os.path.join(out_dir, name)
+
+    with open(f"{base}_index.csv", newline="") as f:
+        index = [
+            {key: (value if key == 'section_id' else int(value)) for key, value in row.items()}
+            for row in csv.DictReader(f)
+        ]
+
+    diagrams = InteractionArrays(*(_load_column(f"{base}_{column}.npy") for column in DIAGRAM_COLUMNS))
+    checks = _load_column(f"{base}_{CHECK_COLUMN}.npy")
+    return index, diagrams, checks
+
+
+def _load_column(path: str) -> np.ndarray:
+    # An empty column cannot be memory-mapped
+    if os.path.getsize(path) == NPY_HEADER_BYTES:
+        return np.load(path)
+    return np.load(path, mmap_mode="r")
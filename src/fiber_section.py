@@ -0,0 +1,223 @@
+# fiber_section.py
+
+from collections import namedtuple, OrderedDict
+from dataclasses import astuple
+import numpy as np
+from interaction_diagram import InteractionArrays
+from section_solver import SectionForces, E_S
+from steel_stress import bilinear_steel_stress
+
+# Horizontal concrete layers: centroid depth from top fiber and area
+FiberMesh = namedtuple("FiberMesh", ["y_mm", "area_mm2"])
+
+# Design steel strain limit εud (pivot A); EC2 leaves it to the National Annex
+EPS_UD = 0.02
+
+# Parabola-rectangle parameters (EC2 Table 3.1)
+ConcreteLaw = namedtuple("ConcreteLaw", ["eps_c2", "eps_cu2", "n"])
+
+# LRU of meshes by geometry; sweeps over many sections must not grow it without bound
+MESH_CACHE_ENTRIES = 256
+_mesh_cache = OrderedDict()
+
+
+def mesh_section(section, n_layers: int = 200, samples: int = 8) -> FiberMesh:
+    """
+    Slices a section into horizontal fiber layers, once per geometry.
+
+    Works for any section exposing width_at(y), e.g. Section,
+    HollowSection and TSection. Layer areas integrate width_at over
+    `samples` sub-points so void and flange edges need not fall on layer
+    boundaries.
+
+    Parameters:
+        section: Section-like object with depth_mm and width_at()
+        n_layers (int): Number of layers over the depth
+        samples (int): Width samples per layer
+
+    Returns:
+        FiberMesh: Cached layer centroids (mm) and areas (mm²)
+    """
+    key = (type(section).__name__, astuple(section), n_layers, samples)
+    mesh = _mesh_cache.get(key)
+    if mesh is not None:
+        _mesh_cache.move_to_end(key)
+        return mesh
+
+    dy = section.depth_mm / n_layers
+    sub = dy * (np.arange(n_layers * samples) + 0.5) / samples
+    widths = section.width_at(sub).reshape(n_layers, samples)
+
+    area = widths.mean(axis=1) * dy
+    y = (widths * sub.reshape(n_layers, samples)).sum(axis=1) / np.maximum(widths.sum(axis=1), 1e-12)
+
+    mesh = FiberMesh(y, area)
+    _mesh_cache[key] = mesh
+    if len(_mesh_cache) > MESH_CACHE_ENTRIES:
+        _mesh_cache.popitem(last=False)
+    return mesh
+
+
+def concrete_law(fck: float) -> ConcreteLaw:
+    """EC2 parabola-rectangle parameters for a given fck (MPa)."""
+    if fck <= 50:
+        return ConcreteLaw(0.002, 0.0035, 2.0)
+    return ConcreteLaw(
+        (2.0 + 0.085 * (fck - 50) ** 0.53) / 1000,
+        (2.6 + 35 * ((90 - fck) / 100) ** 4) / 1000,
+        1.4 + 23.4 * ((90 - fck) / 100) ** 4
+    )
+
+
+def parabola_rectangle_stress(strain, f_cd: float, law: ConcreteLaw, alpha_cc: float = 0.85) -> np.ndarray:
+    """
+    EC2 parabola-rectangle design stress for strain arrays of any shape.
+
+    Parameters:
+        strain (array-like): Strains, compression positive
+        f_cd (float): Design compressive strength (MPa)
+        law (ConcreteLaw): Parabola-rectangle parameters
+        alpha_cc (float): Long-term strength factor
+
+    Returns:
+        np.ndarray: Compressive stress (MPa), zero in tension
+    """
+    strain = np.asarray(strain, dtype=float)
+    ratio = np.clip(strain / law.eps_c2, 0.0, 1.0)
+    return (alpha_cc * f_cd) * (1.0 - (1.0 - ratio) ** law.n)
+
+
+class FiberSection:
+    """
+    Fiber-discretised section evaluated for whole batches of strain planes.
+
+    The concrete mesh and bar arrays (with their lever arms) are built once;
+    every evaluation is then two (n_planes × n_fibers) broadcasts.
+
+    Parameters:
+        section: Section, HollowSection or TSection
+        material (Material): Material with fck, fcd and fyd
+        layout (RebarLayout, optional): Reinforcement layout
+        n_layers (int): Concrete layers over the depth
+        alpha_cc (float): Long-term strength factor
+        hardening_ratio (float): Post-yield steel slope as a fraction of E_s
+        eps_ud (float): Steel strain limit for the ultimate planes (pivot A)
+
+    Methods:
+        forces(eps_top, eps_bottom): N and M about the centroid per strain plane
+        diagram(steps): Ultimate N–M diagram from EC2 pivot strain planes
+    """
+
+    def __init__(self, section, material, layout=None, n_layers: int = 200,
+                 alpha_cc: float = 0.85, hardening_ratio: float = 0.0, eps_ud: float = EPS_UD):
+        self.section = section
+        self.material = material
+        self.alpha_cc = alpha_cc
+        self.hardening_ratio = hardening_ratio
+        self.eps_ud = eps_ud
+        self.law = concrete_law(material.fck)
+
+        mesh = mesh_section(section, n_layers)
+        centroid = section.centroid_mm
+
+        self._y_c = mesh.y_mm / section.depth_mm          # normalised depth
+        self._area_c = mesh.area_mm2
+        self._arm_c = mesh.area_mm2 * (centroid - mesh.y_mm)
+
+        areas, depths = layout.as_arrays() if layout is not None else (np.empty(0), np.empty(0))
+        self._y_s = depths / section.depth_mm
+        self._area_s = areas
+        self._arm_s = areas * (centroid - depths)
+        self._d_max = depths.max() if depths.size else section.depth_mm
+
+    def forces(self, eps_top, eps_bottom) -> SectionForces:
+        """
+        Section resultants for a batch of plane strain states.
+
+        Parameters:
+            eps_top (array-like): Strain at the top fiber, compression positive
+            eps_bottom (array-like): Strain at the bottom fiber
+
+        Returns:
+            SectionForces: N (N) and M about the gross centroid (N·mm) per plane
+        """
+        eps_top = np.atleast_1d(np.asarray(eps_top, dtype=float))[:, None]
+        eps_bottom = np.atleast_1d(np.asarray(eps_bottom, dtype=float))[:, None]
+        slope = eps_bottom - eps_top
+
+        sigma_c = parabola_rectangle_stress(eps_top + slope * self._y_c, self.material.fcd, self.law, self.alpha_cc)
+        sigma_s = bilinear_steel_stress(eps_top + slope * self._y_s, self.material.fyd, E_S, self.hardening_ratio)
+
+        N = sigma_c @ self._area_c + sigma_s @ self._area_s
+        M = sigma_c @ self._arm_c + sigma_s @ self._arm_s
+        return SectionForces(N, M)
+
+    def ultimate_planes(self, steps: int = 200) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        EC2 ultimate strain planes from pure tension to uniform compression.
+
+        The first plane is uniform tension at −εud (labelled x = 0). Pivot A
+        then holds the deepest bar at −εud while the top strain rises to
+        εcu2. From x_AB = εcu2·d / (εcu2 + εud) to h the top fiber sits at
+        εcu2 (pivot B). Finally the plane rotates about pivot C until the
+        whole section sits at εc2. No bar strain ever exceeds εud.
+
+        Returns:
+            tuple: (x_mm, eps_top, eps_bottom); x = inf for the last plane
+        """
+        h, d = self.section.depth_mm, self._d_max
+        eps_c2, eps_cu2, eps_ud = self.law.eps_c2, self.law.eps_cu2, self.eps_ud
+
+        # Pivot A: strain −εud at depth d
+        top_a = eps_cu2 * np.arange(1, steps) / steps
+        x_a = d * top_a / (top_a + eps_ud)
+        bottom_a = top_a - (top_a + eps_ud) * h / d
+
+        # Pivot B: εcu2 at the top fiber
+        x_b = np.linspace(eps_cu2 * d / (eps_cu2 + eps_ud), h, steps)
+        top_b = np.full(x_b.shape, eps_cu2)
+        bottom_b = eps_cu2 * (1.0 - h / x_b)
+
+        # Pivot C: strain εc2 at depth (1 − εc2/εcu2)·h
+        t = np.arange(1, steps + 1) / steps
+        top_c = eps_cu2 + t * (eps_c2 - eps_cu2)
+        bottom_c = t * eps_c2
+        with np.errstate(divide='ignore'):
+            x_c = np.where(top_c > bottom_c, h * top_c / (top_c - bottom_c), np.inf)
+
+        return (
+            np.concatenate([[0.0], x_a, x_b, x_c]),
+            np.concatenate([[-eps_ud], top_a, top_b, top_c]),
+            np.concatenate([[-eps_ud], bottom_a, bottom_b, bottom_c]),
+        )
+
+    def diagram(self, steps: int = 200) -> InteractionArrays:
+        """
+        Ultimate N–M diagram in the same columnar format as the block solver.
+
+        Parameters:
+            steps (int): Planes per pivot region
+
+        Returns:
+            InteractionArrays: x (mm), N (N), M about centroid (N·mm)
+        """
+        x, top, bottom = self.ultimate_planes(steps)
+        result = self.forces(top, bottom)
+        return InteractionArrays(x, result.axial_force_N, result.bending_moment_Nmm)
+
+
+# Optional test block
+if __name__ == "__main__":
+    from materials import Material
+    from section import Section, HollowSection
+    from rebar import RebarLayout
+
+    material = Material(name="C30", fck=30, fyk=500)
+    layout = RebarLayout()
+    layout.add_group(20, 4, 50)
+    layout.add_group(20, 4, 550)
+
+    for section in (Section(width_mm=400, depth_mm=600), HollowSection(width_mm=400, depth_mm=600, wall_mm=120)):
+        diagram = FiberSection(section, material, layout).diagram()
+        print(f"{section}\n  N: {diagram.axial_force_N.min() / 1e3:.0f} … {diagram.axial_force_N.max() / 1e3:.0f} kN, "
+              f"M max: {diagram.bending_moment_Nmm.max() / 1e6:.0f} kNm")
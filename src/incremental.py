@@ -0,0 +1,136 @@
+# incremental.py
+
+from collections import OrderedDict
+import numpy as np
+from interaction_diagram import InteractionArrays
+from section_solver import SectionForces, EPS_CU, concrete_forces, steel_forces, neutral_axis_sweep
+from instrumentation import default_instrumentation as instrumentation
+
+
+class ContributionCache:
+    """
+    LRU cache of the separate parts that add up to a section diagram.
+
+    The concrete block depends only on (b, h, fcd) and each rebar group only
+    on its own (ø, count, depth) plus h, fyd and εcu. Both are evaluated on
+    the standard x sweep for (h, steps), so cached parts can be summed
+    directly. After an edit to fyk, one group or the loads, only the parts
+    whose inputs changed are recomputed.
+
+    Parameters:
+        max_entries (int): Parts kept before least recently used ones are evicted
+
+    Attributes:
+        hits (int): Parts reused
+        misses (int): Parts computed
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def _get(self, key, compute) -> SectionForces:
+        forces = self._entries.get(key)
+        if forces is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            instrumentation.count("contribution_hits")
+            return forces
+
+        self.misses += 1
+        instrumentation.count("contribution_misses")
+        forces = compute()
+        self._entries[key] = forces
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return forces
+
+    def concrete(self, section, material, steps: int = 200) -> SectionForces:
+        """Concrete block forces on the x sweep, keyed by (b, h, fcd, steps)."""
+        key = ('concrete', section.width_mm, section.depth_mm, material.fcd, steps)
+        return self._get(key, lambda: concrete_forces(
+            neutral_axis_sweep(section.depth_mm, steps), section.width_mm, section.depth_mm, material.fcd
+        ))
+
+    def group(self, group, section, material, steps: int = 200, eps_cu: float = EPS_CU) -> SectionForces:
+        """One RebarGroup's forces on the x sweep, keyed by (ø, count, depth, h, fyd, steps, εcu)."""
+        key = ('group', group.diameter_mm, group.count, group.depth_mm, section.depth_mm, material.fyd, steps, eps_cu)
+        return self._get(key, lambda: steel_forces(
+            neutral_axis_sweep(section.depth_mm, steps),
+            np.array([group.area_mm2]), np.array([float(group.depth_mm)]),
+            section.depth_mm, material.fyd, eps_cu
+        ))
+
+    def diagram(self, section, material, layout, steps: int = 200, eps_cu: float = EPS_CU) -> InteractionArrays:
+        """
+        Section diagram assembled from cached parts.
+
+        Returns:
+            InteractionArrays: Same sweep and values as generate_section_diagram
+        """
+        concrete = self.concrete(section, material, steps)
+        N = concrete.axial_force_N.copy()
+        M = concrete.bending_moment_Nmm.copy()
+        for group in layout.groups:
+            steel = self.group(group, section, material, steps, eps_cu)
+            N += steel.axial_force_N
+            M += steel.bending_moment_Nmm
+        return InteractionArrays(neutral_axis_sweep(section.depth_mm, steps), N, M)
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Process-wide cache used when callers do not pass their own
+default_contributions = ContributionCache()
+
+
+def incremental_section_diagram(
+    section,
+    material,
+    layout,
+    steps: int = 200,
+    eps_cu: float = EPS_CU,
+    cache: ContributionCache = None
+) -> InteractionArrays:
+    """
+    Drop-in for section_solver.generate_section_diagram that reuses every
+    unchanged concrete and rebar-group contribution.
+
+    Parameters:
+        section (Section): Section geometry
+        material (Material): Material with fcd and fyd
+        layout (RebarLayout): Reinforcement layout
+        steps (int): Number of x-depth steps
+        eps_cu (float): Ultimate concrete strain
+        cache (ContributionCache, optional): Defaults to default_contributions
+
+    Returns:
+        InteractionArrays: x, N (N) and M about centroid (N·mm)
+    """
+    cache = cache if cache is not None else default_contributions
+    return cache.diagram(section, material, layout, steps, eps_cu)
+
+
+# Optional test block
+if __name__ == "__main__":
+    from materials import Material
+    from section import Section
+    from rebar import RebarLayout
+
+    section = Section(width_mm=300, depth_mm=500)
+    layout = RebarLayout()
+    layout.add_group(20, 3, 50)
+    layout.add_group(20, 3, 450)
+
+    for fyk in (400, 500):
+        incremental_section_diagram(section, Material(name="C30", fck=30, fyk=fyk), layout)
+    layout.groups[1].count = 4
+    incremental_section_diagram(section, Material(name="C30", fck=30, fyk=500), layout)
+
+    print(f"{default_contributions.hits} parts reused, {default_contributions.misses} computed")
@@ -0,0 +1,146 @@
+# instrumentation.py
+
+import cProfile
+import io
+import json
+import os
+import pstats
+import sys
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+
+
+class Instrumentation:
+    """
+    Per-stage wall-clock timers, named counters and an optional cProfile run.
+
+    Timers and counters are plain dict updates, cheap enough to leave on
+    permanently; only the profiler and the JSON report are opt-in.
+
+    Attributes:
+        stages (dict): Stage name → [seconds, calls]
+        counters (Counter): Counter name → count
+
+    Methods:
+        stage(name): Context manager timing one pipeline stage
+        count(name, n): Increments a counter
+        start_profiler() / stop_profiler(): Wraps a cProfile.Profile
+        drain() / merge(snapshot): Ship worker-process figures to the parent
+        save_report(path, **extra): Writes the JSON report (and .prof file)
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Clears all timers, counters and any finished profile."""
+        self.stages = {}
+        self.counters = Counter()
+        self._profiler = None
+        self._profile_stats = None
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - start)
+
+    def add_time(self, name: str, seconds: float, calls: int = 1):
+        entry = self.stages.setdefault(name, [0.0, 0])
+        entry[0] += seconds
+        entry[1] += calls
+
+    def count(self, name: str, n: int = 1):
+        self.counters[name] += n
+
+    def start_profiler(self):
+        self._profiler = cProfile.Profile()
+        self._profiler.enable()
+
+    def stop_profiler(self):
+        if self._profiler is None:
+            return
+        self._profiler.disable()
+        self._profile_stats = pstats.Stats(self._profiler, stream=io.StringIO())
+        self._profiler = None
+
+    def drain(self) -> dict:
+        """Returns the current timers and counters and starts them afresh."""
+        snapshot = {"stages": self.stages, "counters": dict(self.counters)}
+        self.stages = {}
+        self.counters = Counter()
+        return snapshot
+
+    def merge(self, snapshot: dict):
+        """Adds a drain() snapshot, e.g. one returned by a worker process."""
+        for name, (seconds, calls) in snapshot["stages"].items():
+            self.add_time(name, seconds, calls)
+        self.counters.update(snapshot["counters"])
+
+    def report(self, top: int = 25) -> dict:
+        """
+        JSON-ready summary of the run so far.
+
+        Parameters:
+            top (int): Profiled functions to list, by cumulative time
+
+        Returns:
+            dict: timestamp, command, total_s, stages, counters and, when
+                profiled, the top functions
+        """
+        data = {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "command": " ".join(sys.argv),
+            "total_s": round(time.perf_counter() - self._started, 6),
+            "stages": {
+                name: {"seconds": round(seconds, 6), "calls": calls}
+                for name, (seconds, calls) in sorted(self.stages.items(), key=lambda item: -item[1][0])
+            },
+            "counters": dict(sorted(self.counters.items())),
+        }
+
+        if self._profile_stats is not None:
+            stats = self._profile_stats.stats
+            rows = sorted(stats.items(), key=lambda item: -item[1][3])[:top]
+            data["profile"] = [
+                {
+                    "function": f"{os.path.basename(filename)}:{line}({func})",
+                    "calls": calls,
+                    "total_s": round(tottime, 6),
+                    "cumulative_s": round(cumtime, 6),
+                }
+                for (filename, line, func), (_, calls, tottime, cumtime, _) in rows
+            ]
+        return data
+
+    def save_report(self, path: str, **extra) -> str:
+        """
+        Writes report() plus any extra fields as JSON. A profiled run also
+        gets the raw stats next to it (same name, .prof) for snakeviz/pstats.
+
+        Returns:
+            str: Path of the JSON report
+        """
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+
+        data = self.report()
+        data.update(extra)
+        if self._profile_stats is not None:
+            prof_path = os.path.splitext(path)[0] + ".prof"
+            self._profile_stats.dump_stats(prof_path)
+            data["profile_path"] = prof_path
+
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        return path
+
+
+# Process-wide recorder shared by the pipeline modules
+default_instrumentation = Instrumentation()
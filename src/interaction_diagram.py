@@ -1,33 +1,163 @@
 # interaction_diagram.py
 
 from collections import namedtuple
-from plot_utils import plot_interaction_diagram
+import numpy as np
 
-# 📦 Result container
+# 📦 Result containers
 InteractionPoint = namedtuple("InteractionPoint", ["neutral_axis_mm", "axial_force_N", "bending_moment_Nmm"])
 
+# Columnar twin of InteractionPoint: one float64 array per field
+InteractionArrays = namedtuple("InteractionArrays", ["neutral_axis_mm", "axial_force_N", "bending_moment_Nmm"])
+
+class DiagramResult:
+    """
+    Compact diagram container: one contiguous (3, n) float64 block holding
+    x, N and M, i.e. 24 bytes per point instead of a namedtuple each.
+
+    Column attributes are views into the block and carry the same names as
+    InteractionArrays, so envelope, export and plotting code accept it
+    unchanged. Indexing and iteration still yield InteractionPoint, so code
+    written for the old list keeps working.
+
+    Parameters:
+        neutral_axis_mm, axial_force_N, bending_moment_Nmm (array-like): Equal-length columns
+
+    Attributes:
+        axial_force_kN, bending_moment_kNm (np.ndarray): Converted copies for reporting and plots
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, neutral_axis_mm, axial_force_N, bending_moment_Nmm):
+        self._data = np.array([neutral_axis_mm, axial_force_N, bending_moment_Nmm], dtype=np.float64)
+
+    @classmethod
+    def from_arrays(cls, arrays: InteractionArrays) -> "DiagramResult":
+        return cls(*arrays)
+
+    @property
+    def neutral_axis_mm(self) -> np.ndarray:
+        return self._data[0]
+
+    @property
+    def axial_force_N(self) -> np.ndarray:
+        return self._data[1]
+
+    @property
+    def bending_moment_Nmm(self) -> np.ndarray:
+        return self._data[2]
+
+    @property
+    def axial_force_kN(self) -> np.ndarray:
+        return self._data[1] / 1e3
+
+    @property
+    def bending_moment_kNm(self) -> np.ndarray:
+        return self._data[2] / 1e6
+
+    @property
+    def nbytes(self) -> int:
+        return self._data.nbytes
+
+    def arrays(self) -> InteractionArrays:
+        """Column views as an InteractionArrays (no copy)."""
+        return InteractionArrays(*self._data)
+
+    def __len__(self) -> int:
+        return self._data.shape[1]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return DiagramResult(*self._data[:, index])
+        return InteractionPoint(*self._data[:, index].tolist())
+
+    def __iter__(self):
+        return (InteractionPoint(*row) for row in zip(*self._data.tolist()))
+
+    def __repr__(self) -> str:
+        return f"DiagramResult({len(self)} points)"
+
+
 # Core generator function
-def generate_interaction_diagram(width_mm: float, depth_mm: float, f_cd: float, steps: int = 20) -> list[InteractionPoint]:
+def generate_interaction_diagram(width_mm: float, depth_mm: float, f_cd: float, steps: int = 20) -> DiagramResult:
     """
     Generates axial-moment interaction points from concrete stress block contribution alone.
 
     Assumes rectangular EC2 block and linear variation with neutral axis depth.
+    Array-backed wrapper around generate_interaction_arrays().
+
+    Parameters:
+        width_mm (float): Section width in mm
+        depth_mm (float): Section depth in mm
+        f_cd (float): Concrete design compressive strength in MPa
+        steps (int): Number of x-depth steps across section (default: 20)
+
+    Returns:
+        DiagramResult: Sequence of InteractionPoint backed by float64 columns
+    """
+    return DiagramResult.from_arrays(generate_interaction_arrays(width_mm, depth_mm, f_cd, steps))
+
+def generate_interaction_arrays(
+    width_mm: float,
+    depth_mm: float,
+    f_cd: float,
+    steps: int = 20,
+    x=None
+) -> InteractionArrays:
+    """
+    Array engine behind generate_interaction_diagram.
+
+    Evaluates the whole neutral-axis sweep in one pass instead of building
+    one InteractionPoint per step.
 
     Parameters:
         width_mm (float): Section width in mm
         depth_mm (float): Section depth in mm
         f_cd (float): Concrete design compressive strength in MPa
         steps (int): Number of x-depth steps across section (default: 20)
+        x (array-like, optional): Explicit neutral axis depths (mm); overrides steps
 
     Returns:
-        List[InteractionPoint]: Collection of axial force and bending moment values
+        InteractionArrays: Columnar x, N and M arrays (mm, N, N·mm)
+    """
+    if x is None:
+        x = depth_mm * np.arange(steps + 1) / steps  # neutral axis depth from top
+    return compute_concrete_block_array(x, width_mm, f_cd)
+
+def generate_interaction_diagram_with_modes(
+    width_mm: float,
+    depth_mm: float,
+    f_cd: float,
+    steps: int = 20,
+    eps_cu: float = 0.0035,
+    eps_su: float = 0.010,
+    f_yd: float = 500 / 1.15,
+    effective_depth_mm: float = None
+) -> list[dict]:
     """
-    diagram = []
-    for i in range(steps + 1):
-        x = depth_mm * i / steps  # neutral axis depth from top
-        block = compute_concrete_block(x, width_mm, f_cd)
-        diagram.append(InteractionPoint(x, block.axial_force_N, block.bending_moment_Nmm))
-    return diagram
+    Interaction points tagged with their failure mode, in the row format
+    plotting.plot_interaction_diagram and export.export_interaction_to_csv read.
+
+    Modes are classified for the whole sweep in one detect_failure_modes
+    call, on the tension steel strain at effective_depth_mm (default: the
+    bottom fiber) against fyd / Es. The balanced depth is added to the sweep,
+    so the point where the mode changes is part of the diagram.
+
+    Returns:
+        List[dict]: 'axial_kN', 'moment_kNm' and 'failure_mode' (short label) per point
+    """
+    from detect_failure_mode import detect_failure_modes, ultimate_strains, balanced_neutral_axis, MODE_KEYS
+
+    d = depth_mm if effective_depth_mm is None else effective_depth_mm
+    x = np.union1d(depth_mm * np.arange(steps + 1) / steps, [balanced_neutral_axis(d, f_yd, eps_cu)])
+    arrays = generate_interaction_arrays(width_mm, depth_mm, f_cd, x=x)
+    codes = detect_failure_modes(*ultimate_strains(x, d, eps_cu, eps_su), eps_cu, f_yd / 200000)
+
+    return [
+        {'axial_kN': N, 'moment_kNm': M, 'failure_mode': MODE_KEYS[c]}
+        for N, M, c in zip((arrays.axial_force_N / 1e3).tolist(), (arrays.bending_moment_Nmm / 1e6).tolist(), codes.tolist())
+    ]
+
 
 # Concrete block model
 def compute_concrete_block(x: float, width_mm: float, f_cd: float) -> InteractionPoint:
@@ -58,6 +188,31 @@ def compute_concrete_block(x: float, width_mm: float, f_cd: float) -> Interactio
 
     return InteractionPoint(x, force_N, moment_Nmm)
 
+def compute_concrete_block_array(x, width_mm: float, f_cd: float) -> InteractionArrays:
+    """
+    Vectorized compute_concrete_block over an array of neutral axis depths.
+
+    Parameters:
+        x (array-like): Neutral axis depths (mm)
+        width_mm (float): Section width (mm)
+        f_cd (float): Design compressive strength (MPa)
+
+    Returns:
+        InteractionArrays: Axial force and moment at every depth in x
+    """
+    x = np.asarray(x, dtype=float)
+
+    alpha = 0.85   # EC2 strength reduction factor
+    gamma = 0.8    # EC2 block height ratio
+
+    # Zero block where the neutral axis sits at or above the top fibre
+    active = np.where(x > 0, x, 0.0)
+
+    force_N = (alpha * f_cd) * (gamma * active * width_mm)
+    moment_Nmm = force_N * (active * 0.4)
+
+    return InteractionArrays(x, force_N, moment_Nmm)
+
 # Optional test block
 if __name__ == "__main__":
     # Sample test values
@@ -67,9 +222,11 @@ if __name__ == "__main__":
 
     points = generate_interaction_diagram(width_mm, depth_mm, f_cd)
 
-    # Extract P and M axes with unit conversions
-    P = [pt.axial_force_N / 1000 for pt in points]     # kN
-    M = [pt.bending_moment_Nmm / 1e6 for pt in points] # kNm
+    # P and M axes with unit conversions
+    P = points.axial_force_kN       # kN
+    M = points.bending_moment_kNm   # kNm
+
+    # Plot visuals (imported here so the module itself stays matplotlib-free)
+    from plot_utils import plot_interaction_diagram
 
-    # Plot visuals
     plot_interaction_diagram(P, M, title="EC2 Concrete Block Interaction Diagram")
\ No newline at end of file
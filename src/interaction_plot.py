@@ -1,10 +1,11 @@
 import matplotlib.pyplot as plt
+import numpy as np
 from typing import List, Optional
-from interaction_diagram import InteractionPoint
+from interaction_diagram import InteractionPoint, DiagramResult
 from plotting import setup_plot_theme  # Centralized styling
 
 def plot_interaction_diagram(
-    points: List[InteractionPoint],
+    points: DiagramResult | List[InteractionPoint],
     title: str = "Axial-Moment Interaction Diagram",
     show_plot: bool = True,
     save_path: Optional[str] = None
@@ -13,7 +14,7 @@ def plot_interaction_diagram(
     Generates and returns a Matplotlib figure for an interaction diagram.
 
     Parameters:
-        points (List[InteractionPoint]): Interaction points from stress block
+        points (DiagramResult | List[InteractionPoint]): Interaction points from stress block
         title (str): Plot title
         show_plot (bool): If True, display the plot window
         save_path (str): If set, saves plot to given path
@@ -23,8 +24,7 @@ def plot_interaction_diagram(
     """
     setup_plot_theme()
 
-    axial = [p.axial_force_N / 1e3 for p in points]    # Convert to kN
-    moment = [p.bending_moment_Nmm / 1e6 for p in points]  # Convert to kNm
+    axial, moment = diagram_in_kN(points)    # kN, kNm
 
     fig, ax = plt.subplots(figsize=(6, 5))
     ax.plot(axial, moment, label="Interaction Curve", color="darkorange", linewidth=2)
@@ -43,4 +43,144 @@ def plot_interaction_diagram(
     if show_plot:
         fig.show()
 
-    return fig
\ No newline at end of file
+    return fig
+
+def diagram_in_kN(diagram):
+    """
+    Returns (axial_kN, moment_kNm) arrays for a DiagramResult,
+    InteractionArrays or list of InteractionPoint.
+    """
+    if isinstance(diagram, DiagramResult):
+        return diagram.axial_force_kN, diagram.bending_moment_kNm
+    if hasattr(diagram, "axial_force_N"):
+        axial = np.asarray(diagram.axial_force_N, dtype=float)
+        moment = np.asarray(diagram.bending_moment_Nmm, dtype=float)
+    else:
+        axial = np.array([p.axial_force_N for p in diagram], dtype=float)
+        moment = np.array([p.bending_moment_Nmm for p in diagram], dtype=float)
+    return axial / 1e3, moment / 1e6
+
+
+class DiagramRenderer:
+    """
+    Headless renderer that reuses one Agg figure for many diagrams.
+
+    The theme is applied once, the figure and line artist are created once,
+    and each render only swaps the line data and title. No pyplot state is
+    touched, so nothing accumulates between renders.
+
+    Parameters:
+        figsize (tuple): Figure size in inches
+        dpi (int): Output resolution for saved PNGs
+    """
+
+    def __init__(self, figsize: tuple = (6, 5), dpi: int = 150):
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        setup_plot_theme()
+
+        self.dpi = dpi
+        self.fig = Figure(figsize=figsize, layout="constrained")
+        FigureCanvasAgg(self.fig)
+
+        ax = self.fig.add_subplot()
+        (self.line,) = ax.plot([], [], label="Interaction Curve", color="darkorange", linewidth=2)
+        ax.set_xlabel("Axial Force P [kN]", fontsize=12)
+        ax.set_ylabel("Bending Moment M [kNm]", fontsize=12)
+        self.title = ax.set_title("", fontsize=14, weight="bold")
+        ax.grid(True, which="both", linestyle="--", alpha=0.3)
+        ax.legend(loc="upper right", fontsize=10)
+        self.ax = ax
+
+    def render(self, diagram, save_path: str, title: str = "Axial-Moment Interaction Diagram"):
+        """
+        Draws one diagram into the shared figure and saves it.
+
+        Parameters:
+            diagram: InteractionArrays or list of InteractionPoint
+            save_path (str): PNG path
+            title (str): Plot title
+        """
+        axial, moment = diagram_in_kN(diagram)
+
+        self.line.set_data(axial, moment)
+        self.title.set_text(title)
+        self.ax.relim()
+        self.ax.autoscale_view()
+
+        self.fig.savefig(save_path, dpi=self.dpi)
+
+
+# Per-process renderer used by RenderPool workers
+_worker_renderer = None
+
+
+def _init_render_worker(figsize, dpi):
+    global _worker_renderer
+    import matplotlib
+    matplotlib.use("Agg")
+    _worker_renderer = DiagramRenderer(figsize, dpi)
+
+
+def _render_job(diagram, save_path, title):
+    _worker_renderer.render(diagram, save_path, title)
+    return save_path
+
+
+class RenderPool:
+    """
+    Background pool of headless renderers.
+
+    Lets the caller keep computing diagrams while earlier ones are drawn.
+    Each worker process owns one DiagramRenderer. At most max_pending
+    renders are queued; submit() blocks beyond that, so a slow renderer
+    holds a bounded number of diagrams instead of every one submitted.
+
+    Parameters:
+        workers (int, optional): Render processes (default: CPU count)
+        figsize (tuple): Figure size in inches
+        dpi (int): Output resolution
+        max_pending (int, optional): Queued renders before submit() waits (default: 2 per worker)
+    """
+
+    def __init__(self, workers: int = None, figsize: tuple = (6, 5), dpi: int = 150, max_pending: int = None):
+        import os
+        from concurrent.futures import ProcessPoolExecutor
+
+        self._pool = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_render_worker,
+            initargs=(figsize, dpi)
+        )
+        self.max_pending = max_pending or 2 * (workers or os.cpu_count() or 1)
+        self._pending = set()
+        self._paths = []
+
+    def submit(self, diagram, save_path: str, title: str = "Axial-Moment Interaction Diagram"):
+        """Queues one render; diagram arrays are pickled to the worker."""
+        if len(self._pending) >= self.max_pending:
+            self._collect(first_only=True)
+        future = self._pool.submit(_render_job, diagram, save_path, title)
+        self._pending.add(future)
+        return future
+
+    def _collect(self, first_only: bool = False):
+        """Keeps the paths of finished renders and drops their futures."""
+        from concurrent.futures import wait, FIRST_COMPLETED, ALL_COMPLETED
+
+        done, self._pending = wait(self._pending, return_when=FIRST_COMPLETED if first_only else ALL_COMPLETED)
+        self._paths.extend(future.result() for future in done)
+
+    def close(self) -> list[str]:
+        """Waits for all queued renders and returns the written paths, in completion order."""
+        self._collect()
+        self._pool.shutdown()
+        paths, self._paths = self._paths, []
+        return paths
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
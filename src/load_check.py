@@ -1,7 +1,9 @@
 # check_load.py
 
 from collections import namedtuple
+import numpy as np
 from detect_failure_mode import detect_failure_mode, FailureMode
+from envelope import InteractionEnvelope
 
 # Output container
 LoadCheckResult = namedtuple("LoadCheckResult", [
@@ -13,6 +15,12 @@ LoadCheckResult = namedtuple("LoadCheckResult", [
     "failure_mode"
 ])
 
+# Batch output container: one array entry per applied (N, M) pair
+BatchLoadCheckResult = namedtuple("BatchLoadCheckResult", [
+    "is_safe",
+    "utilisation"
+])
+
 def validate_section(fc, fy, b, h, rebar_layout, design_N, design_M):
     # Simplified placeholder logic
     capacity_N = fc * b * h * 0.4
@@ -79,4 +87,43 @@ def check_load(
         resisting_N=resisting_N,
         resisting_M=resisting_M,
         failure_mode=failure
-    )
\ No newline at end of file
+    )
+
+def check_loads_batch(applied_N, applied_M, envelope, hogging=None) -> BatchLoadCheckResult:
+    """
+    Checks many applied (N, M) pairs against one interaction envelope.
+
+    Each load is scaled along the ray from the origin until it meets the
+    envelope boundary; utilisation is |load| / |capacity on that ray|.
+    Raw diagram arrays are wrapped in an InteractionEnvelope first, so every
+    call is one binary search per load over the angle-sorted edges. Callers
+    checking several batches against one diagram should build the
+    envelope once and pass it in.
+
+    Parameters:
+        applied_N (array-like): Applied axial loads (N), compression positive
+        applied_M (array-like): Applied moments (N·mm)
+        envelope: InteractionEnvelope, or InteractionArrays from the diagram generators
+        hogging (optional): M <= 0 branch for a raw diagram, e.g. from
+            section_solver.hogging_section_diagram; needed unless the
+            reinforcement is symmetric about mid-depth
+
+    Returns:
+        BatchLoadCheckResult: Named tuple with:
+            - is_safe (np.ndarray[bool]): True where utilisation <= 1
+            - utilisation (np.ndarray[float]): Ratio per load, 0 for a zero load
+
+    Raises:
+        ValueError: If a raw diagram does not enclose the origin
+    """
+    applied_N = np.atleast_1d(np.asarray(applied_N, dtype=float))
+    applied_M = np.atleast_1d(np.asarray(applied_M, dtype=float))
+
+    if not hasattr(envelope, "utilisation"):
+        envelope = InteractionEnvelope(envelope, hogging)
+
+    utilisation = envelope.utilisation(applied_N, applied_M)
+    return BatchLoadCheckResult(
+        is_safe=utilisation <= 1.0,
+        utilisation=utilisation
+    )
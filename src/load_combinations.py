@@ -0,0 +1,189 @@
+# load_combinations.py
+
+from collections import namedtuple
+import numpy as np
+from materials import DesignCode, ACTION_FACTORS
+from load_check import check_loads_batch
+
+# One characteristic variable action effect (N, N·mm); wind is reversible by default
+VariableAction = namedtuple("VariableAction", ["category", "axial_force_N", "bending_moment_Nmm", "reversible"])
+
+# Streaming check outcome over every generated combination
+CombinationCheck = namedtuple("CombinationCheck", [
+    "max_utilisation",
+    "governing_index",       # position in generation order
+    "governing_N",
+    "governing_M",
+    "governing_factors",     # factor per action: permanent first, then variables
+    "count"
+])
+
+DEFAULT_CHUNK = 65536
+
+
+def as_variable_action(action) -> VariableAction:
+    """Accepts a VariableAction or a schedule dict {'category', 'N', 'M', 'reversible'?}."""
+    if isinstance(action, VariableAction):
+        return action
+    category = action.get('category', 'imposed')
+    return VariableAction(category, float(action['N']), float(action['M']), action.get('reversible', category == 'wind'))
+
+
+def _factor_sets(n_permanent: int, variables: list, code: DesignCode) -> list[list[np.ndarray]]:
+    """
+    Per-action factor choices for each leading-action case of EN 1990 eq. 6.10:
+
+        Σ γG,j·Gk,j  +  γQ·Qk,1  +  Σ γQ·ψ0,i·Qk,i
+
+    Each permanent action is either unfavourable (γG,sup) or favourable
+    (γG,inf). The leading variable takes γQ; each accompanying one is absent
+    or takes γQ·ψ0. Reversible actions also appear with the opposite sign.
+    A permanent-only case covers loads with no variable action present.
+    """
+    factors = ACTION_FACTORS[code]
+    permanent = [np.array([factors['gamma_G_sup'], factors['gamma_G_inf']])] * n_permanent
+
+    def signed(values, reversible):
+        values = np.asarray(values, dtype=float)
+        return np.unique(np.concatenate([values, -values])) if reversible else values
+
+    sets = [permanent + [np.zeros(1)] * len(variables)]
+    for lead in range(len(variables)):
+        choices = []
+        for i, action in enumerate(variables):
+            if i == lead:
+                choices.append(signed([factors['gamma_Q']], action.reversible))
+            else:
+                psi_0 = factors['psi_0'][action.category]
+                choices.append(signed([0.0, factors['gamma_Q'] * psi_0], action.reversible))
+        sets.append(permanent + choices)
+    return sets
+
+
+def combination_count(n_permanent: int, variables, code: DesignCode = DesignCode.EUROCODE) -> int:
+    """Number of combinations combination_factors() will yield, without generating them."""
+    variables = [as_variable_action(v) for v in variables]
+    return sum(int(np.prod([c.size for c in choices])) for choices in _factor_sets(n_permanent, variables, code))
+
+
+def combination_factors(n_permanent: int, variables, code: DesignCode = DesignCode.EUROCODE, chunk_size: int = DEFAULT_CHUNK):
+    """
+    Lazily yields ULS factor rows in chunks.
+
+    Combinations are numbered per leading-action case and each chunk of
+    indices is decoded with np.unravel_index, so only one chunk of rows
+    exists at a time however large the full set is.
+
+    Parameters:
+        n_permanent (int): Number of permanent actions
+        variables (list): VariableAction entries (or schedule dicts)
+        code (DesignCode): Source of γ and ψ0 (materials.ACTION_FACTORS)
+        chunk_size (int): Rows per yielded array
+
+    Yields:
+        np.ndarray: (k, n_permanent + n_variables) factor rows
+    """
+    variables = [as_variable_action(v) for v in variables]
+    if n_permanent + len(variables) == 0:
+        return
+    for choices in _factor_sets(n_permanent, variables, code):
+        shape = tuple(c.size for c in choices)
+        total = int(np.prod(shape))
+        for start in range(0, total, chunk_size):
+            digits = np.unravel_index(np.arange(start, min(start + chunk_size, total)), shape)
+            yield np.column_stack([c[d] for c, d in zip(choices, digits)])
+
+
+def uls_combinations(permanent, variables, code: DesignCode = DesignCode.EUROCODE, chunk_size: int = DEFAULT_CHUNK):
+    """
+    Lazily yields (N, M) arrays of ULS design effects.
+
+    Parameters:
+        permanent (array-like): (n_G, 2) characteristic (N, M) per permanent action
+        variables (list): VariableAction entries (or schedule dicts)
+        code (DesignCode): Source of γ and ψ0
+        chunk_size (int): Combinations per yielded pair
+
+    Yields:
+        tuple: (N, M) arrays in N and N·mm, compression positive
+    """
+    effects = _effects(permanent, variables)
+    for factors in combination_factors(len(effects) - len(variables), variables, code, chunk_size):
+        design = factors @ effects
+        yield design[:, 0], design[:, 1]
+
+
+def _effects(permanent, variables) -> np.ndarray:
+    permanent = np.asarray(permanent, dtype=float).reshape(-1, 2)
+    variables = [as_variable_action(v) for v in variables]
+    variable = np.array([[v.axial_force_N, v.bending_moment_Nmm] for v in variables], dtype=float).reshape(-1, 2)
+    return np.vstack([permanent, variable])
+
+
+def check_combinations(
+    envelope,
+    permanent,
+    variables,
+    code: DesignCode = DesignCode.EUROCODE,
+    chunk_size: int = DEFAULT_CHUNK
+) -> CombinationCheck:
+    """
+    Streams every ULS combination through check_loads_batch and keeps only
+    the running maximum, so memory stays at one chunk.
+
+    Parameters:
+        envelope: InteractionEnvelope or diagram accepted by check_loads_batch
+        permanent (array-like): (n_G, 2) characteristic (N, M) per permanent action
+        variables (list): VariableAction entries (or schedule dicts)
+        code (DesignCode): Source of γ and ψ0
+        chunk_size (int): Combinations per batch check
+
+    Returns:
+        CombinationCheck: Governing utilisation, its combination and the total count
+    """
+    variables = [as_variable_action(v) for v in variables]
+    effects = _effects(permanent, variables)
+    n_permanent = len(effects) - len(variables)
+
+    best = CombinationCheck(-np.inf, None, None, None, None, 0)
+    count = 0
+    for factors in combination_factors(n_permanent, variables, code, chunk_size):
+        design = factors @ effects
+        utilisation = check_loads_batch(design[:, 0], design[:, 1], envelope).utilisation
+
+        k = int(np.argmax(utilisation))
+        if utilisation[k] > best.max_utilisation:
+            best = CombinationCheck(
+                float(utilisation[k]), count + k, float(design[k, 0]), float(design[k, 1]),
+                factors[k].tolist(), 0
+            )
+        count += utilisation.size
+
+    if count == 0:
+        return CombinationCheck(0.0, None, None, None, None, 0)
+    return best._replace(count=count)
+
+
+# Optional test block
+if __name__ == "__main__":
+    from materials import Material
+    from section import Section
+    from rebar import RebarLayout
+    from section_solver import generate_section_diagram, hogging_section_diagram
+    from envelope import InteractionEnvelope
+
+    material = Material(name="C30", fck=30, fyk=500)
+    section = Section(width_mm=300, depth_mm=500)
+    layout = RebarLayout()
+    layout.add_group(20, 3, 50)
+    layout.add_group(20, 3, 450)
+    envelope = InteractionEnvelope(generate_section_diagram(section, material, layout), hogging_section_diagram(section, material, layout))
+
+    permanent = [[600e3, 20e6], [150e3, 5e6]]
+    variables = [VariableAction("imposed", 300e3, 15e6, False)] * 4 + [
+        VariableAction("wind", 20e3, 60e6, True), VariableAction("snow", 50e3, 2e6, False)
+    ]
+
+    result = check_combinations(envelope, permanent, variables)
+    print(f"{result.count} combinations, max utilisation {result.max_utilisation:.3f} "
+          f"at N = {result.governing_N / 1e3:.0f} kN, M = {result.governing_M / 1e6:.0f} kNm")
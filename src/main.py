@@ -4,30 +4,39 @@ from cli import parse_cli_args
 from materials import Material
 from section import Section
 from interaction_diagram import generate_interaction_diagram
-from interaction_plot import plot_interaction_diagram
 from save_utils import save_summary
+from instrumentation import default_instrumentation as instrumentation
 
 
 def run_designer():
     """
     Central routine that initializes objects, generates interaction diagram,
     and optionally visualizes output.
+
+    With --profile the run is wrapped in cProfile and a JSON timing report
+    is written to exports/profile_<b>x<h>.json.
     """
     # Step 1: Parse CLI
-    args = parse_cli_args()
+    with instrumentation.stage("parse"):
+        args = parse_cli_args()
+
+    if args["profile"]:
+        instrumentation.start_profiler()
 
     # Step 2: Build material + section
-    material = Material(
-        name=f"C{args['fck']}",
-        fck=args['fck'],
-        fyk=args['fyk'],
-        code=args['code']
-    )
-
-    section = Section(
-        width_mm=args['width_mm'],
-        depth_mm=args['depth_mm']
-    )
+    with instrumentation.stage("setup"):
+        material = Material(
+            name=f"C{args['fck']}",
+            fck=args['fck'],
+            fyk=args['fyk'],
+            code=args['code']
+        )
+
+        section = Section(
+            width_mm=args['width_mm'],
+            depth_mm=args['depth_mm']
+        )
+    instrumentation.count("sections_processed")
 
     # Preview Summary Block
     from utils import banner, format_summary
@@ -39,36 +48,48 @@ def run_designer():
     print(format_summary(section.to_dict()))
 
     # Step 3: Generate interaction diagram
-    points = generate_interaction_diagram(
-        width_mm=section.width_mm,
-        depth_mm=section.depth_mm,
-        f_cd=material.fcd
-    )
+    with instrumentation.stage("diagram"):
+        points = generate_interaction_diagram(
+            width_mm=section.width_mm,
+            depth_mm=section.depth_mm,
+            f_cd=material.fcd
+        )
+    instrumentation.count("points_evaluated", len(points))
 
     # Export summary block
     if args["save_summary"]:
-        save_summary(material, section, points)
+        with instrumentation.stage("summary"):
+            save_summary(material, section, points)
+
+    title = f"{material.name} | {section.width_mm}×{section.depth_mm} mm"
 
-    # Step 4: Plot diagram
-    plot_interaction_diagram(
-        points=points,
-        title=f"{material.name} | {section.width_mm}×{section.depth_mm} mm"
-    )
+    # Step 4: Plot diagram (skipped in headless runs)
+    if not args["no_show"]:
+        with instrumentation.stage("plot"):
+            from interaction_plot import plot_interaction_diagram  # matplotlib loads only here
+
+            plot_interaction_diagram(points=points, title=title)
 
     # Step 5: Preview key point (optional debug)
     print(f"\n▶ First Point: N={points[0].axial_force_N:.1f} N, M={points[0].bending_moment_Nmm:.1f} N·mm")
 
     # Step 6: Save plot if requested
-    from interaction_plot import save_plot  # Make sure this import exists at the top or right here
-
     if args["save_diagram"]:
-        P = [pt.axial_force_N / 1000 for pt in points]  # kN
-        M = [pt.bending_moment_Nmm / 1e6 for pt in points]  # kNm
+        from utils import ensure_export_folder
+        from interaction_plot import DiagramRenderer
 
-        filename = f"exports/diagram_{section.width_mm}x{section.depth_mm}.png"
-        save_plot(P, M, filename=filename)
+        with instrumentation.stage("export_png"):
+            ensure_export_folder()
+            filename = f"exports/diagram_{section.width_mm}x{section.depth_mm}.png"
+            DiagramRenderer(dpi=300).render(points, save_path=filename, title=title)
         print(f"✅ Diagram saved to {filename}")
 
+    # Step 7: Timing report
+    if args["profile"]:
+        instrumentation.stop_profiler()
+        report = instrumentation.save_report(f"exports/profile_{section.width_mm}x{section.depth_mm}.json")
+        print(f"⏱️  Profile report saved to {report}")
+
 
 if __name__ == "__main__":
     run_designer()
\ No newline at end of file
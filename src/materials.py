@@ -12,6 +12,32 @@ DESIGN_CODE_FACTORS = {
     DesignCode.ACI: {'gamma_c': 1.0, 'gamma_s': 1.0}  # Placeholder — customize if needed
 }
 
+# ULS action factors by design code (EN 1990 Table A1.2(B), eq. 6.10)
+ACTION_FACTORS = {
+    DesignCode.EUROCODE: {
+        'gamma_G_sup': 1.35, 'gamma_G_inf': 1.0, 'gamma_Q': 1.5,
+        'psi_0': {'imposed': 0.7, 'wind': 0.6, 'snow': 0.5}
+    },
+    DesignCode.ACI: {
+        'gamma_G_sup': 1.2, 'gamma_G_inf': 0.9, 'gamma_Q': 1.6,
+        'psi_0': {'imposed': 0.5, 'wind': 0.5, 'snow': 0.5}
+    }  # Placeholder — customize if needed
+}
+
+def design_strengths(fck, fyk, code: DesignCode = DesignCode.EUROCODE):
+    """
+    Applies the code's partial factors to characteristic strengths.
+
+    Works element-wise on NumPy arrays as well as on plain floats, so whole
+    parameter grids can be converted in one call.
+
+    Returns:
+        tuple: (fcd, fyd) in MPa
+    """
+    factors = DESIGN_CODE_FACTORS[code]
+    return fck / factors['gamma_c'], fyk / factors['gamma_s']
+
+
 class Material:
     """
     Represents structural material properties for concrete or steel.
@@ -45,9 +71,9 @@ class Material:
         self._apply_design_factors()
 
     def _apply_design_factors(self):
-        factors = DESIGN_CODE_FACTORS.get(self.code, {})
-        self.fcd = self.fck / factors['gamma_c'] if self.fck else None
-        self.fyd = self.fyk / factors['gamma_s'] if self.fyk else None
+        fcd, fyd = design_strengths(self.fck or 0.0, self.fyk or 0.0, self.code)
+        self.fcd = fcd if self.fck else None
+        self.fyd = fyd if self.fyk else None
 
     def to_dict(self) -> dict:
         """Returns a dictionary of material properties."""
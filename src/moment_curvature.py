@@ -0,0 +1,214 @@
+# moment_curvature.py
+
+from collections import namedtuple
+import numpy as np
+from fiber_section import FiberSection, EPS_UD
+
+# One entry per converged curvature step
+MomentCurvature = namedtuple("MomentCurvature", [
+    "curvature_per_mm",
+    "moment_Nmm",
+    "neutral_axis_mm",
+    "eps_top"
+])
+
+
+def _brent(f, a: float, b: float, fa: float, fb: float, xtol: float, maxiter: int = 60) -> float:
+    """
+    Brent's root finder on a bracket [a, b] with f(a)·f(b) <= 0.
+
+    Mixes inverse quadratic interpolation, secant and bisection steps, so it
+    converges superlinearly on smooth stretches and never leaves the bracket.
+    """
+    if fa == 0:
+        return a
+    if fb == 0:
+        return b
+
+    c, fc = a, fa
+    d = e = b - a
+    for _ in range(maxiter):
+        if fb * fc > 0:
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+
+        tol = 2 * np.finfo(float).eps * abs(b) + xtol / 2
+        m = (c - b) / 2
+        if abs(m) <= tol or fb == 0:
+            return b
+
+        if abs(e) >= tol and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:
+                p, q = 2 * m * s, 1 - s
+            else:
+                q, r = fa / fc, fb / fc
+                p = s * (2 * m * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+            if p > 0:
+                q = -q
+            p = abs(p)
+            if 2 * p < min(3 * m * q - abs(tol * q), abs(e * q)):
+                e, d = d, p / q
+            else:
+                d = e = m
+        else:
+            d = e = m
+
+        a, fa = b, fb
+        b += d if abs(d) > tol else (tol if m > 0 else -tol)
+        fb = f(b)
+
+    return b
+
+
+def _solve_x(residual, x0: float, step: float, xtol: float):
+    """
+    Root of a residual that increases with x, bracketed outward from x0.
+
+    Returns None when no sign change is found (no equilibrium).
+    """
+    f0 = residual(x0)
+    if f0 == 0:
+        return x0
+
+    # The root lies below x0 when the section is already over-compressed there
+    direction = -1.0 if f0 > 0 else 1.0
+    a, fa = x0, f0
+    for _ in range(40):
+        b = a + direction * step
+        fb = residual(b)
+        if fa * fb <= 0:
+            return _brent(residual, a, b, fa, fb, xtol)
+        a, fa = b, fb
+        step *= 2
+    return None
+
+
+def moment_curvature(
+    section,
+    material,
+    layout,
+    axial_force_N: float = 0.0,
+    max_curvature: float = None,
+    steps: int = 100,
+    eps_ud: float = EPS_UD,
+    n_layers: int = 100,
+    xtol: float = 1e-3,
+    fiber_section: FiberSection = None
+) -> MomentCurvature:
+    """
+    M–κ curve at a fixed axial load.
+
+    For each curvature the neutral axis depth x is solved from N(x) = N_Ed
+    with Brent's method. A secant predictor through the last two steps
+    places the first trial next to the answer, and the bracket is stepped
+    out from it by the previous prediction error, so most steps settle in
+    a few force evaluations.
+
+    The step that first crushes the concrete or exceeds eps_ud is replaced
+    by the ultimate point itself: x is solved with the strain plane pinned
+    at εcu2 on the top fiber, or at eps_ud on the deepest bar when the
+    steel governs.
+
+    Parameters:
+        section: Section, HollowSection or TSection
+        material (Material): Material with fck, fcd and fyd
+        layout (RebarLayout): Reinforcement layout
+        axial_force_N (float): Applied axial force (N), compression positive
+        max_curvature (float, optional): Last curvature (1/mm);
+            default εcu2 / (0.1·h), which always reaches crushing
+        steps (int): Curvature increments
+        eps_ud (float): Steel strain limit
+        n_layers (int): Concrete layers (ignored when fiber_section is given)
+        xtol (float): Neutral-axis tolerance (mm)
+        fiber_section (FiberSection, optional): Prebuilt engine to reuse
+
+    Returns:
+        MomentCurvature: Arrays up to the ultimate point, or up to the last
+            step with an equilibrium
+    """
+    engine = fiber_section or FiberSection(section, material, layout, n_layers)
+    h = section.depth_mm
+    eps_cu2 = engine.law.eps_cu2
+    _, bar_depths = layout.as_arrays()
+    d_max = bar_depths.max() if bar_depths.size else h
+
+    if max_curvature is None:
+        max_curvature = eps_cu2 / (0.1 * h)
+    curvatures = max_curvature * np.arange(1, steps + 1) / steps
+
+    out_k, out_M, out_x, out_eps = [0.0], [0.0], [np.nan], [0.0]
+    step = 0.05 * h
+    last = {}
+
+    def solve(plane, x0: float, step: float):
+        """Solves N(x) = N_Ed for a strain plane x → (eps_top, eps_bottom); keeps the forces at the root."""
+        def residual(x_trial: float) -> float:
+            forces = engine.forces(*plane(x_trial))
+            last[x_trial] = forces
+            return float(forces.axial_force_N[0]) - axial_force_N
+
+        last.clear()
+        x = _solve_x(residual, x0, step, xtol)
+        return (x, last[x]) if x is not None else (None, None)
+
+    def record(kappa: float, x: float, forces):
+        out_k.append(kappa)
+        out_M.append(float(forces.bending_moment_Nmm[0]))
+        out_x.append(x)
+        out_eps.append(kappa * x)
+
+    for kappa in curvatures:
+        if len(out_x) > 2:
+            # Secant predictor through the last two converged steps
+            slope = (out_x[-1] - out_x[-2]) / (out_k[-1] - out_k[-2])
+            x0 = out_x[-1] + slope * (kappa - out_k[-1])
+        else:
+            x0 = out_x[-1] if len(out_x) > 1 else section.centroid_mm
+
+        x, forces = solve(lambda x_: (kappa * x_, kappa * (x_ - h)), x0, step)
+        if x is None:
+            break  # no equilibrium at this curvature
+
+        if kappa * x > eps_cu2 or kappa * (d_max - x) > eps_ud:
+            # Concrete pivot first; the steel pivot governs if it leaves the bar past eps_ud
+            x_u, forces_u = solve(lambda x_: (eps_cu2, eps_cu2 * (x_ - h) / x_), x, 10 * xtol)
+            if x_u is None or eps_cu2 * (d_max - x_u) / x_u > eps_ud:
+                x_u, forces_u = solve(
+                    lambda x_: (eps_ud * x_ / (d_max - x_), eps_ud * (x_ - h) / (d_max - x_)), x, 10 * xtol
+                )
+                kappa_u = eps_ud / (d_max - x_u) if x_u is not None else None
+            else:
+                kappa_u = eps_cu2 / x_u
+            if kappa_u is not None:
+                record(kappa_u, x_u, forces_u)
+            break
+
+        # Next bracket step follows how far off this step's prediction was
+        step = max(2 * abs(x - x0), 10 * xtol)
+        record(kappa, x, forces)
+
+    return MomentCurvature(
+        np.array(out_k), np.array(out_M), np.array(out_x), np.array(out_eps)
+    )
+
+
+# Optional test block
+if __name__ == "__main__":
+    from materials import Material
+    from section import Section
+    from rebar import RebarLayout
+
+    material = Material(name="C30", fck=30, fyk=500)
+    section = Section(width_mm=300, depth_mm=500)
+    layout = RebarLayout()
+    layout.add_group(16, 2, 50)
+    layout.add_group(20, 4, 450)
+
+    curve = moment_curvature(section, material, layout, axial_force_N=200e3)
+    print(f"{curve.moment_Nmm.size} points, M max = {curve.moment_Nmm.max() / 1e6:.1f} kNm "
+          f"at κ = {curve.curvature_per_mm[curve.moment_Nmm.argmax()]:.2e} 1/mm")
@@ -0,0 +1,136 @@
+# parameter_sweep.py
+
+import csv
+import os
+from collections import namedtuple
+import numpy as np
+from materials import DesignCode, design_strengths
+from section_solver import E_S, EPS_CU, concrete_forces, steel_forces, neutral_axis_sweep
+from detect_failure_mode import balanced_neutral_axis
+
+# One array per output column, each with the shape of the parameter grid
+CapacityTable = namedtuple("CapacityTable", [
+    "width_mm", "depth_mm", "fck", "fyk", "rho",
+    "max_axial_N", "min_axial_N", "max_moment_Nmm",
+    "balanced_axial_N", "balanced_moment_Nmm"
+])
+
+# Combinations × x-steps evaluated per broadcast chunk
+CHUNK_CELLS = 2_000_000
+
+
+def _chunk_capacities(b, h, fcd, fyd, rho, cover_ratio, xi, eps_cu):
+    """
+    Capacity figures for a chunk of combinations (1-D arrays of equal length).
+
+    The same concrete_forces / steel_forces as generate_section_diagram,
+    broadcast over an (n_combo × n_xi) grid of x = ξ·h with one bar layer
+    at cover_ratio·h from each face.
+    """
+    b, h, fcd, fyd, rho = (a[:, None] for a in (b, h, fcd, fyd, rho))
+    x = xi[None, :] * h
+    depths = np.stack([cover_ratio * h, (1.0 - cover_ratio) * h], axis=-1)   # (n, 1, 2)
+    areas = np.repeat(rho[..., None] * b[..., None] * h[..., None] / 2, 2, axis=-1)
+
+    def forces(x):
+        concrete = concrete_forces(x, b, h, fcd)
+        steel = steel_forces(x, areas, depths, h, fyd, eps_cu)
+        return concrete.axial_force_N + steel.axial_force_N, concrete.bending_moment_Nmm + steel.bending_moment_Nmm
+
+    N, M = forces(x)
+
+    # Balanced point: bottom bars reach εy exactly as the top reaches εcu
+    N_b, M_b = forces(balanced_neutral_axis((1.0 - cover_ratio) * h, fyd, eps_cu, E_S))
+
+    return N.max(axis=1), N.min(axis=1), M.max(axis=1), N_b[:, 0], M_b[:, 0]
+
+
+def capacity_sweep(
+    width_mm,
+    depth_mm,
+    fck,
+    fyk,
+    rho=(0.01,),
+    code: DesignCode = DesignCode.EUROCODE,
+    cover_ratio: float = 0.1,
+    steps: int = 200,
+    eps_cu: float = EPS_CU
+) -> CapacityTable:
+    """
+    Capacity table over a full width × depth × fck × fyk × rho grid.
+
+    Design strengths come from materials.design_strengths, the same path
+    Material uses. The diagram is evaluated by broadcasting the whole
+    combination grid against the neutral-axis sweep, in chunks of about
+    CHUNK_CELLS values.
+
+    Parameters:
+        width_mm, depth_mm, fck, fyk, rho (iterable): Grid axes
+        code (DesignCode): Partial-factor set
+        cover_ratio (float): Bar centre distance from each face / h
+        steps (int): Neutral-axis steps over 0 … h/λ (plus the far branch and squash)
+        eps_cu (float): Ultimate concrete strain
+
+    Returns:
+        CapacityTable: Arrays of grid shape (n_b, n_h, n_fck, n_fyk, n_rho), N and N·mm
+    """
+    axes = [np.asarray(a, dtype=float) for a in (width_mm, depth_mm, fck, fyk, rho)]
+    grid = np.meshgrid(*axes, indexing="ij")
+    shape = grid[0].shape
+    b, h, fck_g, fyk_g, rho_g = (g.ravel() for g in grid)
+    fcd, fyd = design_strengths(fck_g, fyk_g, code)
+
+    xi = neutral_axis_sweep(1.0, steps)   # x/h, the same sweep as a section diagram
+
+    outputs = [np.empty(b.size) for _ in range(5)]
+    chunk = max(1, CHUNK_CELLS // xi.size)
+    for start in range(0, b.size, chunk):
+        part = slice(start, start + chunk)
+        results = _chunk_capacities(b[part], h[part], fcd[part], fyd[part], rho_g[part], cover_ratio, xi, eps_cu)
+        for out, values in zip(outputs, results):
+            out[part] = values
+
+    return CapacityTable(*(g.reshape(shape) for g in grid), *(o.reshape(shape) for o in outputs))
+
+
+def save_capacity_table(table: CapacityTable, path: str):
+    """
+    Writes the table as compressed .npz (grid-shaped arrays) or, for a
+    .csv path, one row per combination in kN / kNm.
+    """
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+
+    if not path.endswith(".csv"):
+        np.savez_compressed(path, **table._asdict())
+        return
+
+    columns = np.column_stack([
+        table.width_mm.ravel(), table.depth_mm.ravel(), table.fck.ravel(), table.fyk.ravel(), table.rho.ravel(),
+        table.max_axial_N.ravel() / 1e3, table.min_axial_N.ravel() / 1e3, table.max_moment_Nmm.ravel() / 1e6,
+        table.balanced_axial_N.ravel() / 1e3, table.balanced_moment_Nmm.ravel() / 1e6,
+    ])
+    with open(path, "w", newline="") as f:
+        csv.writer(f).writerow([
+            'width_mm', 'depth_mm', 'fck', 'fyk', 'rho', 'max_axial_kN', 'min_axial_kN',
+            'max_moment_kNm', 'balanced_axial_kN', 'balanced_moment_kNm'
+        ])
+        np.savetxt(f, columns, delimiter=",", fmt="%.6g")
+
+
+def run_sweep_cli():
+    """Entry point: parameter grids in, capacity table out."""
+    from cli import parse_sweep_args
+
+    args = parse_sweep_args()
+    table = capacity_sweep(
+        args['width_mm'], args['depth_mm'], args['fck'], args['fyk'], args['rho'],
+        code=args['code'], cover_ratio=args['cover_ratio'], steps=args['steps']
+    )
+    save_capacity_table(table, args['out'])
+    print(f"✅ {table.max_axial_N.size} combinations → {args['out']}")
+
+
+if __name__ == "__main__":
+    run_sweep_cli()
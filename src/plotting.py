@@ -1,22 +1,71 @@
 # plotting.py
 
 import matplotlib.pyplot as plt
+import numpy as np
+
+_theme_applied = False
+
+def setup_plot_theme(force: bool = False):
+    """
+    Applies consistent styling to all plots.
+
+    The style is applied once per process; later calls are no-ops unless
+    force=True.
+    """
+    global _theme_applied
+    if _theme_applied and not force:
+        return
+    _theme_applied = True
 
-def setup_plot_theme():
-    """Applies consistent styling to all plots."""
     plt.style.use('seaborn-v0_8-darkgrid')
     plt.rcParams['font.size'] = 10
     plt.rcParams['axes.labelweight'] = 'bold'
     plt.rcParams['figure.facecolor'] = 'white'
 
 
-def plot_interaction_diagram(diagram: list, save_path: str = None):
+def screen_downsample(x, y, width_px: int, height_px: int, groups=None) -> np.ndarray:
+    """
+    Indices of the first point landing in each screen pixel (per group).
+
+    Points closer together than one pixel draw identically, so keeping one
+    per pixel cell leaves the rendered image unchanged.
+
+    Parameters:
+        x, y (np.ndarray): Data coordinates
+        width_px, height_px (int): Pixel extent covering the data range
+        groups (np.ndarray, optional): Integer group per point; each group
+            keeps its own points so no colour disappears where groups meet
+
+    Returns:
+        np.ndarray: Sorted indices of the points to keep
+    """
+    if x.size == 0:
+        return np.arange(0)
+
+    def cells(values, n):
+        lo, hi = values.min(), values.max()
+        span = hi - lo if hi > lo else 1.0
+        return np.minimum(((values - lo) / span * n).astype(np.int64), n - 1)
+
+    flat = cells(x, width_px) * height_px + cells(y, height_px)
+    if groups is not None:
+        flat = flat + np.asarray(groups, dtype=np.int64) * (width_px * height_px)
+    _, first = np.unique(flat, return_index=True)
+    return np.sort(first)
+
+
+def plot_interaction_diagram(diagram: list, save_path: str = None, downsample: bool = True):
     """
     Plots the interaction diagram with failure modes.
 
+    Points are grouped by failure mode and each group is drawn as a single
+    scatter collection; dense diagrams are thinned to one point per screen
+    pixel first.
+
     Parameters:
     - diagram (list): Output from generate_interaction_diagram_with_modes()
     - save_path (str, optional): If given, saves the plot to file
+    - downsample (bool): Thin points to the figure's pixel grid (default: True)
     """
     colors = {
         "compression": "red",
@@ -25,11 +74,24 @@ def plot_interaction_diagram(diagram: list, save_path: str = None):
         "other": "gray"
     }
 
-    for pt in diagram:
-        axial = pt['axial_kN']
-        moment = pt['moment_kNm']
-        mode = pt['failure_mode']
-        plt.scatter(moment, axial, color=colors.get(mode, "gray"), s=20)
+    axial = np.fromiter((pt['axial_kN'] for pt in diagram), dtype=float, count=len(diagram))
+    moment = np.fromiter((pt['moment_kNm'] for pt in diagram), dtype=float, count=len(diagram))
+    mode_index = {mode: i for i, mode in enumerate(colors)}
+    codes = np.fromiter((mode_index.get(pt['failure_mode'], mode_index["other"]) for pt in diagram),
+                        dtype=np.int64, count=len(diagram))
+
+    keep = np.arange(axial.size)
+    if downsample:
+        fig = plt.gcf()
+        dpi = 300 if save_path else fig.dpi
+        width_px, height_px = (fig.get_size_inches() * dpi).astype(int)
+        keep = screen_downsample(moment, axial, width_px, height_px, groups=codes)
+
+    # One collection per failure mode instead of one artist per point
+    for code, color in enumerate(colors.values()):
+        group = keep[codes[keep] == code]
+        if group.size:
+            plt.scatter(moment[group], axial[group], color=color, s=20)
 
     plt.xlabel("Moment (kNm)")
     plt.ylabel("Axial Load (kN)")
@@ -39,4 +101,4 @@ def plot_interaction_diagram(diagram: list, save_path: str = None):
     if save_path:
         plt.savefig(save_path, dpi=300)
     else:
-        plt.show()
\ No newline at end of file
+        plt.show()
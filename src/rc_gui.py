@@ -1,8 +1,17 @@
+import queue
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox
+import numpy as np
+from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from interaction_diagram import generate_interaction_diagram
-from materials import DesignCode
+from interaction_diagram import generate_interaction_arrays
+from load_check import validate_section
+from materials import Material, DesignCode
+
+# Neutral-axis chunks per run; progress and cancel are checked between chunks
+PROGRESS_CHUNKS = 50
+POLL_MS = 30
 
 def validate_inputs():
     try:
@@ -14,46 +23,121 @@ def validate_inputs():
         design_N = float(load_entry.get())
         design_M = float(moment_entry.get())
         code = DesignCode[code_var.get()]
+        steps = int(steps_entry.get())
 
         # Optional range checks
         if not (10 <= fc <= 100): raise ValueError("fc should be between 10 and 100 MPa")
         if not (200 <= fy <= 600): raise ValueError("fy should be between 200 and 600 MPa")
         if not rebar_layout: raise ValueError("Rebar layout cannot be empty")
+        if steps < 1: raise ValueError("Resolution must be at least 1 step")
 
-        return fc, fy, b, h, rebar_layout, design_N, design_M, code
+        return fc, fy, b, h, rebar_layout, design_N, design_M, code, steps
     except Exception as e:
         raise ValueError(f"Input error: {e}")
 
-def run_analysis():
+# ---- Background computation ----
+def compute_job(inputs, cancel, results):
+    """
+    Worker-thread body: builds the diagram chunk by chunk and posts
+    ('progress', fraction), then ('done', payload) or ('error', message),
+    to the results queue. Never touches Tk.
+    """
     try:
-        fc, fy, b, h, rebar_layout, design_N, design_M, code = validate_inputs()
-        fig, result = generate_interaction_diagram(fc, fy, b, h, rebar_layout, code, design_N, design_M)
-
-        # Format diagram
-        ax = fig.axes[0]
-        ax.set_xlabel("Axial Load [kN]")
-        ax.set_ylabel("Moment [kNm]")
-        ax.set_title("Interaction Diagram")
-
-        # Display diagram
-        update_canvas(fig)
-
-        # Summary popup
-        summary = (
-            f"Axial Load Check: {'✓ PASS' if result['passes_N'] else '✗ FAIL'}\n"
-            f"Moment Check: {'✓ PASS' if result['passes_M'] else '✗ FAIL'}\n\n"
-            f"N Capacity = {result['capacity_N'] / 1000:.1f} kN\n"
-            f"M Capacity = {result['capacity_M'] / 1e6:.2f} kNm"
-        )
-        messagebox.showinfo("Validation Summary", summary)
-
+        fc, fy, b, h, rebar_layout, design_N, design_M, code, steps = inputs
+        material = Material(name=f"C{fc:g}", fck=fc, fyk=fy, code=code)
+
+        x = h * np.arange(steps + 1) / steps
+        N = np.empty_like(x)
+        M = np.empty_like(x)
+        for part in np.array_split(np.arange(x.size), min(PROGRESS_CHUNKS, x.size)):
+            if cancel.is_set():
+                return
+            chunk = generate_interaction_arrays(b, h, material.fcd, x=x[part])
+            N[part] = chunk.axial_force_N
+            M[part] = chunk.bending_moment_Nmm
+            results.put(('progress', (part[-1] + 1) / x.size))
+
+        result = validate_section(fc, fy, b, h, rebar_layout, design_N, design_M)
+        results.put(('done', (inputs, N, M, result)))
     except Exception as e:
+        results.put(('error', str(e)))
+
+def run_analysis(event=None):
+    global current_job
+    try:
+        inputs = validate_inputs()
+    except ValueError as e:
         messagebox.showerror("Analysis Error", str(e))
+        return
+
+    # A new run supersedes whatever is still computing
+    cancel_analysis()
+    job = {'cancel': threading.Event(), 'results': queue.Queue()}
+    current_job = job
+    threading.Thread(target=compute_job, args=(inputs, job['cancel'], job['results']), daemon=True).start()
+
+    progress['value'] = 0
+    status_var.set("Computing…")
+    cancel_button.state(['!disabled'])
+    root.after(POLL_MS, poll_job, job)
+
+def cancel_analysis():
+    global current_job
+    if current_job is not None:
+        current_job['cancel'].set()
+        current_job = None
+        status_var.set("Cancelled")
+        cancel_button.state(['disabled'])
+
+def poll_job(job):
+    """Drains the worker's queue on the Tk thread; reschedules itself until done."""
+    if job is not current_job:
+        return  # cancelled or superseded
+
+    while True:
+        try:
+            kind, payload = job['results'].get_nowait()
+        except queue.Empty:
+            root.after(POLL_MS, poll_job, job)
+            return
+
+        if kind == 'progress':
+            progress['value'] = 100 * payload
+        elif kind == 'done':
+            finish_job(payload)
+            return
+        else:
+            finish_job(None)
+            messagebox.showerror("Analysis Error", payload)
+            return
+
+def finish_job(payload):
+    global current_job, last_result
+    current_job = None
+    cancel_button.state(['disabled'])
+    if payload is None:
+        status_var.set("Failed")
+        return
+
+    progress['value'] = 100
+    last_result = payload
+    inputs, N, M, result = payload
+    design_N, design_M = inputs[5], inputs[6]
+    update_canvas(N / 1e3, M / 1e6, design_N / 1e3, design_M / 1e6)
+
+    status_var.set(
+        f"Axial Load Check: {'✓ PASS' if result['passes_N'] else '✗ FAIL'}\n"
+        f"Moment Check: {'✓ PASS' if result['passes_M'] else '✗ FAIL'}\n\n"
+        f"N Capacity = {result['capacity_N'] / 1000:.1f} kN\n"
+        f"M Capacity = {result['capacity_M'] / 1e6:.2f} kNm"
+    )
 
 def export_results():
+    if last_result is None:
+        messagebox.showerror("Export Error", "Run an analysis first.")
+        return
     try:
-        fc, fy, b, h, rebar_layout, design_N, design_M, code = validate_inputs()
-        fig, result = generate_interaction_diagram(fc, fy, b, h, rebar_layout, code, design_N, design_M)
+        (fc, fy, b, h, rebar_layout, design_N, design_M, code, steps), _, _, result = last_result
 
         # Save text summary
         with open("rc_analysis_summary.txt", "w") as f:
@@ -76,13 +160,13 @@ def export_results():
     except Exception as e:
         messagebox.showerror("Export Error", str(e))
 
-def update_canvas(fig):
-    global canvas
-    if canvas:
-        canvas.get_tk_widget().destroy()
-    canvas = FigureCanvasTkAgg(fig, master=plot_frame)
-    canvas.draw()
-    canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+def update_canvas(axial_kN, moment_kNm, design_N_kN, design_M_kNm):
+    """Swaps the line data on the persistent canvas instead of rebuilding it."""
+    curve.set_data(axial_kN, moment_kNm)
+    design_point.set_data([design_N_kN], [design_M_kNm])
+    ax.relim()
+    ax.autoscale_view()
+    canvas.draw_idle()
 
 # ---- UI Layout ----
 root = tk.Tk()
@@ -121,8 +205,34 @@ ttk.Label(input_frame, text="Design code:").pack()
 code_var = tk.StringVar(value='EUROCODE')
 ttk.Combobox(input_frame, textvariable=code_var, values=['EUROCODE', 'ACI']).pack()
 
+ttk.Label(input_frame, text="Resolution (neutral-axis steps):").pack()
+steps_entry = ttk.Entry(input_frame); steps_entry.insert(0, "200"); steps_entry.pack()
+
 ttk.Button(input_frame, text="Run Analysis", command=run_analysis).pack(pady=5)
+cancel_button = ttk.Button(input_frame, text="Cancel", command=cancel_analysis, state='disabled')
+cancel_button.pack(pady=5)
 ttk.Button(input_frame, text="Export Summary + Diagram", command=export_results).pack(pady=5)
 
-canvas = None
-root.mainloop()
\ No newline at end of file
+progress = ttk.Progressbar(input_frame, mode='determinate', maximum=100)
+progress.pack(fill=tk.X, pady=5)
+status_var = tk.StringVar(value="")
+ttk.Label(input_frame, textvariable=status_var, justify=tk.LEFT).pack(pady=5)
+
+# One figure and canvas for the lifetime of the window
+fig = Figure(figsize=(6, 5))
+ax = fig.add_subplot()
+curve, = ax.plot([], [], color="darkorange", linewidth=2, label="Interaction Curve")
+design_point, = ax.plot([], [], "o", color="black", label="Design Load")
+ax.set_xlabel("Axial Load [kN]")
+ax.set_ylabel("Moment [kNm]")
+ax.set_title("Interaction Diagram")
+ax.legend(loc="upper right")
+
+canvas = FigureCanvasTkAgg(fig, master=plot_frame)
+canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+current_job = None
+last_result = None
+
+root.bind("<Return>", run_analysis)
+root.mainloop()
@@ -1,6 +1,7 @@
 # rebar.py
 
 from math import pi
+import numpy as np
 
 
 class RebarGroup:
@@ -31,6 +32,14 @@ class RebarGroup:
         single_area = (pi * self.diameter_mm ** 2) / 4
         return single_area * self.count
 
+    def to_dict(self) -> dict:
+        """Returns the group in the format accepted by RebarLayout.load_from_list."""
+        return {
+            'diameter': self.diameter_mm,
+            'count': self.count,
+            'depth': self.depth_mm
+        }
+
     def __repr__(self) -> str:
         return f"{self.count}ø{self.diameter_mm} @ {self.depth_mm}mm"
 
@@ -43,6 +52,9 @@ class RebarLayout:
         add_group(diameter_mm, count, depth_mm): Adds a rebar group.
         load_from_list(data): Loads layout from list of dicts.
         total_area(): Returns total steel area (mm²).
+        as_arrays(): Returns group areas and depths as NumPy arrays.
+        flipped(depth_mm): Returns the layout seen with the section upside down.
+        to_dict(): Returns a serialisable description of the layout.
         __repr__(): Preview-friendly layout string.
     """
 
@@ -69,6 +81,33 @@ class RebarLayout:
         """Returns total steel area across all groups (mm²)."""
         return sum(group.area_mm2 for group in self.groups)
 
+    def as_arrays(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns (areas_mm2, depths_mm) with one entry per rebar group.
+
+        Used by the section solver to evaluate all groups in one broadcast.
+        """
+        areas = np.array([group.area_mm2 for group in self.groups], dtype=float)
+        depths = np.array([group.depth_mm for group in self.groups], dtype=float)
+        return areas, depths
+
+    def flipped(self, depth_mm: float) -> "RebarLayout":
+        """
+        Same bars measured from the other face (depth h − d), i.e. the layout
+        of the section turned upside down for hogging moments.
+        """
+        layout = RebarLayout()
+        for group in self.groups:
+            layout.add_group(group.diameter_mm, group.count, depth_mm - group.depth_mm)
+        return layout
+
+    def to_dict(self) -> dict:
+        """Returns a dictionary of rebar groups and total steel area."""
+        return {
+            'groups': [group.to_dict() for group in self.groups],
+            'total_area_mm2': self.total_area()
+        }
+
     def __iter__(self):
         return iter(self.groups)
 
@@ -0,0 +1,131 @@
+# rebar_optimiser.py
+
+from collections import namedtuple
+import numpy as np
+from rebar import RebarLayout
+from envelope import InteractionEnvelope
+from section_solver import hogging_branch
+from incremental import default_contributions
+
+# Optimiser output
+OptimisedLayout = namedtuple("OptimisedLayout", [
+    "layout",            # RebarLayout, or None if no candidate passes
+    "area_mm2",
+    "max_utilisation",
+    "candidates_checked"
+])
+
+DEFAULT_DIAMETERS = (12, 16, 20, 25, 32)
+
+
+def symmetric_layout(section, diameter_mm: float, count: int, cover_mm: float) -> RebarLayout:
+    """`count` bars of one diameter on both the top and bottom faces."""
+    edge = cover_mm + diameter_mm / 2
+    layout = RebarLayout()
+    layout.add_group(diameter_mm, count, edge)
+    layout.add_group(diameter_mm, count, section.depth_mm - edge)
+    return layout
+
+
+def max_bars_per_face(section, diameter_mm: float, cover_mm: float) -> int:
+    """Bars that fit across the width with EC2 clear spacing max(ø, 20 mm)."""
+    spacing = max(diameter_mm, 20.0)
+    usable = section.width_mm - 2 * cover_mm + spacing
+    return int(usable // (diameter_mm + spacing))
+
+
+def optimise_layout(
+    section,
+    material,
+    applied_N,
+    applied_M,
+    diameters=DEFAULT_DIAMETERS,
+    cover_mm: float = 40.0,
+    min_count: int = 2,
+    steps: int = 200
+) -> OptimisedLayout:
+    """
+    Finds the lightest symmetric layout whose envelope contains every load.
+
+    For one diameter more bars never shrink the envelope, so the smallest
+    passing count is found by binary search. The search for each diameter
+    is also capped at the lightest area already found. Envelopes are
+    assembled from incremental.default_contributions, so the concrete part
+    and every bar group already tried (in this or an earlier run) are reused.
+
+    Parameters:
+        section (Section): Section geometry
+        material (Material): Material with fcd and fyd
+        applied_N (array-like): Applied axial loads (N), compression positive
+        applied_M (array-like): Applied moments (N·mm)
+        diameters (iterable): Candidate bar diameters (mm)
+        cover_mm (float): Cover to bar surface (mm)
+        min_count (int): Minimum bars per face
+        steps (int): Neutral-axis steps per envelope
+
+    Returns:
+        OptimisedLayout: Lightest passing layout and its utilisation
+    """
+    applied_N = np.atleast_1d(np.asarray(applied_N, dtype=float))
+    applied_M = np.atleast_1d(np.asarray(applied_M, dtype=float))
+
+    checked = 0
+
+    def utilisation(diameter_mm: float, count: int) -> float:
+        nonlocal checked
+        checked += 1
+        layout = symmetric_layout(section, diameter_mm, count, cover_mm)
+        envelope = InteractionEnvelope(
+            default_contributions.diagram(section, material, layout, steps),
+            hogging_branch(default_contributions.diagram(section, material, layout.flipped(section.depth_mm), steps))
+        )
+        return float(envelope.utilisation(applied_N, applied_M).max())
+
+    best = None  # (area, diameter, count, utilisation)
+    for diameter in sorted(diameters):
+        bar_area = np.pi * diameter ** 2 / 4
+        hi = max_bars_per_face(section, diameter, cover_mm)
+        if best is not None:
+            # Only counts lighter than the current best are worth checking
+            hi = min(hi, int(np.ceil(best[0] / (2 * bar_area))) - 1)
+        lo = min_count
+        if hi < lo:
+            continue
+
+        # Heaviest admissible candidate first: if it fails, the rest do too
+        u_hi = utilisation(diameter, hi)
+        if u_hi > 1.0:
+            continue
+
+        found = (hi, u_hi)
+        while lo < found[0]:
+            mid = (lo + found[0]) // 2
+            u_mid = utilisation(diameter, mid)
+            if u_mid <= 1.0:
+                found = (mid, u_mid)
+            else:
+                lo = mid + 1
+
+        area = 2 * found[0] * bar_area
+        if best is None or area < best[0]:
+            best = (area, diameter, found[0], found[1])
+
+    if best is None:
+        return OptimisedLayout(None, None, None, checked)
+
+    area, diameter, count, util = best
+    return OptimisedLayout(symmetric_layout(section, diameter, count, cover_mm), area, util, checked)
+
+
+# Optional test block
+if __name__ == "__main__":
+    from materials import Material
+    from section import Section
+
+    material = Material(name="C30", fck=30, fyk=500)
+    section = Section(width_mm=300, depth_mm=500)
+
+    result = optimise_layout(section, material, applied_N=[800e3, 1500e3, 200e3], applied_M=[180e6, 150e6, 160e6])
+    print(result.layout)
+    print(f"As = {result.area_mm2:.0f} mm², utilisation = {result.max_utilisation:.3f}, "
+          f"{result.candidates_checked} candidates checked")
@@ -12,7 +12,7 @@ def save_summary(material, section, points, out_dir="exports", filename=None):
     Parameters:
         material: Material object with .to_dict()
         section: Section object with .to_dict()
-        points: List of InteractionPoint
+        points: DiagramResult / InteractionArrays, or a list of InteractionPoint
         out_dir (str): Folder to save file
         filename (str): Optional override of filename
     """
@@ -20,8 +20,12 @@ def save_summary(material, section, points, out_dir="exports", filename=None):
         makedirs(out_dir)
 
     # Extract key metrics
-    max_P = max(pt.axial_force_N for pt in points) / 1000     # kN
-    max_M = max(pt.bending_moment_Nmm for pt in points) / 1e6 # kNm
+    if hasattr(points, "axial_force_N"):
+        max_P = float(points.axial_force_N.max()) / 1000     # kN
+        max_M = float(points.bending_moment_Nmm.max()) / 1e6 # kNm
+    else:
+        max_P = max(pt.axial_force_N for pt in points) / 1000     # kN
+        max_M = max(pt.bending_moment_Nmm for pt in points) / 1e6 # kNm
 
     data = {
         "timestamp": datetime.now().isoformat(timespec="seconds"),
@@ -31,7 +35,7 @@ def save_summary(material, section, points, out_dir="exports", filename=None):
             "max_axial_kN": round(max_P, 2),
             "max_moment_kNm": round(max_M, 2)
         },
-        "point_count": len(points)
+        "point_count": len(points.axial_force_N) if hasattr(points, "axial_force_N") else len(points)
     }
 
     fname = filename or f"summary_{section.width_mm}x{section.depth_mm}.json"
@@ -2,6 +2,7 @@
 
 from dataclasses import dataclass
 from typing import Optional
+import numpy as np
 
 @dataclass
 class Section:
@@ -23,6 +24,10 @@ class Section:
         """Moment of inertia about horizontal axis (mm⁴)"""
         return (self.width_mm * self.depth_mm**3) / 12
 
+    def width_at(self, y_mm) -> np.ndarray:
+        """Section width (mm) at depth(s) y_mm from top fiber"""
+        return np.full(np.shape(y_mm), float(self.width_mm))
+
     def to_dict(self) -> dict:
         """Export geometric properties to a dictionary."""
         return {
@@ -34,4 +39,95 @@ class Section:
         }
 
     def __repr__(self) -> str:
-        return f"Section {self.width_mm}×{self.depth_mm} mm | Area={self.area_mm2:.2f} mm² | Centroid={self.centroid_mm:.1f} mm"
\ No newline at end of file
+        return f"Section {self.width_mm}×{self.depth_mm} mm | Area={self.area_mm2:.2f} mm² | Centroid={self.centroid_mm:.1f} mm"
+
+
+@dataclass(repr=False)
+class HollowSection(Section):
+    """Rectangular box section with uniform wall thickness."""
+    wall_mm: float
+
+    def __post_init__(self):
+        if not 0 < self.wall_mm < min(self.width_mm, self.depth_mm) / 2:
+            raise ValueError(
+                f"wall_mm must be > 0 and leave a void inside {self.width_mm}×{self.depth_mm} mm, got {self.wall_mm}"
+            )
+
+    @property
+    def area_mm2(self) -> float:
+        """Cross-sectional area (mm²)"""
+        inner = (self.width_mm - 2 * self.wall_mm) * (self.depth_mm - 2 * self.wall_mm)
+        return self.width_mm * self.depth_mm - inner
+
+    @property
+    def inertia_mm4(self) -> float:
+        """Moment of inertia about horizontal axis (mm⁴)"""
+        inner = (self.width_mm - 2 * self.wall_mm) * (self.depth_mm - 2 * self.wall_mm) ** 3
+        return (self.width_mm * self.depth_mm**3 - inner) / 12
+
+    def width_at(self, y_mm) -> np.ndarray:
+        """Full width in the flanges, two walls in between"""
+        y_mm = np.asarray(y_mm, dtype=float)
+        in_void = (y_mm > self.wall_mm) & (y_mm < self.depth_mm - self.wall_mm)
+        return np.where(in_void, 2 * self.wall_mm, float(self.width_mm))
+
+    def to_dict(self) -> dict:
+        data = super().to_dict()
+        data['wall_mm'] = self.wall_mm
+        return data
+
+    def __repr__(self) -> str:
+        return f"HollowSection {self.width_mm}×{self.depth_mm}×{self.wall_mm} mm | Area={self.area_mm2:.2f} mm² | Centroid={self.centroid_mm:.1f} mm"
+
+
+@dataclass(repr=False)
+class TSection(Section):
+    """T-section: width_mm is the flange width, depth_mm the overall depth."""
+    web_width_mm: float
+    flange_depth_mm: float
+
+    def __post_init__(self):
+        if not 0 < self.flange_depth_mm < self.depth_mm:
+            raise ValueError(f"flange_depth_mm must be between 0 and depth {self.depth_mm} mm, got {self.flange_depth_mm}")
+        if not 0 < self.web_width_mm <= self.width_mm:
+            raise ValueError(f"web_width_mm must be > 0 and at most the flange width {self.width_mm} mm, got {self.web_width_mm}")
+
+    @property
+    def _parts(self) -> tuple:
+        """(area, centroid from top) of flange and web"""
+        flange = (self.width_mm * self.flange_depth_mm, self.flange_depth_mm / 2)
+        web_depth = self.depth_mm - self.flange_depth_mm
+        web = (self.web_width_mm * web_depth, self.flange_depth_mm + web_depth / 2)
+        return flange, web
+
+    @property
+    def area_mm2(self) -> float:
+        """Cross-sectional area (mm²)"""
+        return sum(area for area, _ in self._parts)
+
+    @property
+    def centroid_mm(self) -> float:
+        """Centroid from top fiber (mm)"""
+        return sum(area * y for area, y in self._parts) / self.area_mm2
+
+    @property
+    def inertia_mm4(self) -> float:
+        """Moment of inertia about horizontal axis (mm⁴)"""
+        flange_own = self.width_mm * self.flange_depth_mm**3 / 12
+        web_own = self.web_width_mm * (self.depth_mm - self.flange_depth_mm)**3 / 12
+        shift = sum(area * (y - self.centroid_mm)**2 for area, y in self._parts)
+        return flange_own + web_own + shift
+
+    def width_at(self, y_mm) -> np.ndarray:
+        """Flange width above flange_depth_mm, web width below"""
+        y_mm = np.asarray(y_mm, dtype=float)
+        return np.where(y_mm < self.flange_depth_mm, float(self.width_mm), float(self.web_width_mm))
+
+    def to_dict(self) -> dict:
+        data = super().to_dict()
+        data['web_width_mm'] = self.web_width_mm
+        data['flange_depth_mm'] = self.flange_depth_mm
+        return data
+
+    def __repr__(self) -> str:
+        return f"TSection {self.width_mm}×{self.depth_mm} mm (web {self.web_width_mm}) | Area={self.area_mm2:.2f} mm² | Centroid={self.centroid_mm:.1f} mm"
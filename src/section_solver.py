@@ -0,0 +1,359 @@
+# section_solver.py
+
+from collections import namedtuple
+import numpy as np
+from interaction_diagram import InteractionArrays
+from steel_stress import steel_stress_array
+
+# EC2 constants
+E_S = 200_000.0   # Steel elastic modulus (MPa)
+EPS_CU = 0.0035   # Ultimate concrete strain
+ALPHA_CC = 0.85   # Stress block strength factor
+LAMBDA = 0.8      # Stress block height ratio
+
+# Far end of the finite x sweep, as a multiple of h. At x = 10·h the bottom
+# fibre strain is 0.9·εcu, past yield for any fyd up to ~630 MPa, so every
+# bar has reached its squash stress and the rest is constant.
+FAR_DEPTH_RATIO = 10.0
+
+# Axial force and moment about the section centroid, one entry per x
+SectionForces = namedtuple("SectionForces", ["axial_force_N", "bending_moment_Nmm"])
+
+
+def concrete_forces(x, width_mm: float, depth_mm: float, f_cd: float) -> SectionForces:
+    """
+    Concrete stress block contribution for an array of neutral axis depths.
+
+    Parameters:
+        x (array-like): Neutral axis depths from top fiber (mm), may contain np.inf
+        width_mm (float): Section width (mm)
+        depth_mm (float): Section depth (mm)
+        f_cd (float): Design compressive strength of concrete (MPa)
+
+    Returns:
+        SectionForces: Compression-positive force (N) and moment about centroid (N·mm)
+    """
+    x = np.asarray(x, dtype=float)
+
+    # Block depth is capped by the section once λx passes the bottom fibre
+    block = np.clip(LAMBDA * x, 0.0, depth_mm)
+    force_N = (ALPHA_CC * f_cd * width_mm) * block
+    moment_Nmm = force_N * (depth_mm / 2 - block / 2)
+
+    return SectionForces(force_N, moment_Nmm)
+
+
+def bar_strains(x, depths_mm: np.ndarray, eps_cu: float = EPS_CU) -> np.ndarray:
+    """
+    Strain-compatibility bar strains for every (x, bar) pair.
+
+    Parameters:
+        x (array-like): Neutral axis depths (mm), shape (n_x,) or any grid shape
+        depths_mm (np.ndarray): Bar depths from top fiber (mm), shape (n_bars,)
+            or broadcastable to x.shape + (n_bars,)
+        eps_cu (float): Strain at the top fiber
+
+    Returns:
+        np.ndarray: Strains of shape x.shape + (n_bars,), compression positive.
+            x = 0 gives -inf (pure tension), x = inf gives eps_cu (uniform).
+    """
+    x = np.asarray(x, dtype=float)[..., None]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return eps_cu * (1.0 - depths_mm / x)
+
+
+def steel_forces(
+    x,
+    areas_mm2: np.ndarray,
+    depths_mm: np.ndarray,
+    depth_mm: float,
+    f_yd: float,
+    eps_cu: float = EPS_CU
+) -> SectionForces:
+    """
+    Reinforcement contribution for an array of neutral axis depths.
+
+    All bars are evaluated as one (n_x × n_bars) broadcast. Section values
+    may also be arrays broadcastable to x (bars on a trailing axis), so a
+    grid of sections is evaluated in the same call.
+
+    Parameters:
+        x (array-like): Neutral axis depths (mm)
+        areas_mm2 (np.ndarray): Group areas (mm²)
+        depths_mm (np.ndarray): Group depths from top fiber (mm)
+        depth_mm (float or np.ndarray): Section depth (mm)
+        f_yd (float or np.ndarray): Design yield strength of steel (MPa)
+        eps_cu (float): Strain at the top fiber
+
+    Returns:
+        SectionForces: Compression-positive force (N) and moment about centroid (N·mm)
+    """
+    x = np.asarray(x, dtype=float)
+    if areas_mm2.size == 0:
+        zeros = np.zeros_like(x)
+        return SectionForces(zeros, zeros.copy())
+
+    strain = bar_strains(x, depths_mm, eps_cu)
+    # Per-x section values are shared by all bars on the trailing axis
+    if np.ndim(f_yd):
+        f_yd = np.expand_dims(f_yd, -1)
+    if np.ndim(depth_mm):
+        depth_mm = np.expand_dims(depth_mm, -1)
+    stress = steel_stress_array(strain, f_yd, f_yd / E_S)
+    forces = stress * areas_mm2
+
+    force_N = forces.sum(axis=-1)
+    lever = depth_mm / 2 - depths_mm
+    moment_Nmm = forces @ lever if lever.ndim == 1 else (forces * lever).sum(axis=-1)
+
+    return SectionForces(force_N, moment_Nmm)
+
+
+def solve_section(x, section, material, layout, eps_cu: float = EPS_CU) -> InteractionArrays:
+    """
+    Strain-compatibility N–M points for a reinforced section.
+
+    Parameters:
+        x (array-like): Neutral axis depths from top fiber (mm)
+        section (Section): Section geometry
+        material (Material): Material with fcd and fyd
+        layout (RebarLayout): Reinforcement layout
+        eps_cu (float): Ultimate concrete strain
+
+    Returns:
+        InteractionArrays: x, N (N) and M about centroid (N·mm)
+    """
+    x = np.asarray(x, dtype=float)
+    areas, depths = layout.as_arrays()
+
+    concrete = concrete_forces(x, section.width_mm, section.depth_mm, material.fcd)
+    steel = steel_forces(x, areas, depths, section.depth_mm, material.fyd, eps_cu)
+
+    return InteractionArrays(
+        x,
+        concrete.axial_force_N + steel.axial_force_N,
+        concrete.bending_moment_Nmm + steel.bending_moment_Nmm
+    )
+
+
+def neutral_axis_sweep(depth_mm: float, steps: int) -> np.ndarray:
+    """
+    Default x sweep: `steps` uniform intervals over 0 … depth/λ (block fills
+    the section), then geometric spacing out to FAR_DEPTH_RATIO·depth, plus
+    x = inf for the squash point.
+
+    Beyond h/λ the block is constant but bars are still moving into
+    compression yield, so that branch is sampled too rather than left as
+    one chord to the squash point. The sweep depends on (depth, steps)
+    only, so cached concrete and bar contributions line up.
+    """
+    x_block = depth_mm / LAMBDA
+    x = x_block * np.arange(steps + 1) / steps
+    far = x_block * np.geomspace(1.0, FAR_DEPTH_RATIO * LAMBDA, far_steps(steps) + 1)[1:]
+    return np.concatenate([x, far, [np.inf]])
+
+
+def far_steps(steps: int) -> int:
+    """Geometric samples between h/λ and FAR_DEPTH_RATIO·h for a given uniform step count."""
+    return max(steps // 4, 8)
+
+
+def generate_section_diagram(
+    section,
+    material,
+    layout,
+    steps: int = 200,
+    eps_cu: float = EPS_CU
+) -> InteractionArrays:
+    """
+    Generates the full N–M diagram including RebarLayout steel forces.
+
+    Parameters:
+        section (Section): Section geometry
+        material (Material): Material with fcd and fyd
+        layout (RebarLayout): Reinforcement layout
+        steps (int): Number of x-depth steps (default: 200)
+        eps_cu (float): Ultimate concrete strain
+
+    Returns:
+        InteractionArrays: From pure tension (x = 0) to squash load (x = inf)
+    """
+    x = neutral_axis_sweep(section.depth_mm, steps)
+    return solve_section(x, section, material, layout, eps_cu)
+
+
+def hogging_branch(flipped_diagram: InteractionArrays) -> InteractionArrays:
+    """
+    Turns the diagram of the flipped section (layout.flipped(h)) into the
+    original section's negative-moment branch by reversing the moment sign.
+    Both branches share the pure-tension (x = 0) and squash (x = ∞) points.
+    """
+    return InteractionArrays(
+        flipped_diagram.neutral_axis_mm, flipped_diagram.axial_force_N, -flipped_diagram.bending_moment_Nmm
+    )
+
+
+def hogging_section_diagram(
+    section,
+    material,
+    layout,
+    steps: int = 200,
+    eps_cu: float = EPS_CU
+) -> InteractionArrays:
+    """
+    Negative-moment (M ≤ 0) branch: the section solved upside down, with the
+    bars at h − d, and moments sign-reversed. x is then measured from the
+    bottom fibre. For layouts symmetric about mid-depth it equals the
+    sagging branch mirrored about M = 0.
+
+    Returns:
+        InteractionArrays: x, N (N) and M about centroid (N·mm)
+    """
+    return hogging_branch(generate_section_diagram(section, material, layout.flipped(section.depth_mm), steps, eps_cu))
+
+
+def yield_breakpoints(depths_mm: np.ndarray, f_yd: float, depth_mm: float, eps_cu: float = EPS_CU) -> np.ndarray:
+    """
+    Neutral axis depths at which the envelope has a kink.
+
+    Every bar at depth d reaches tension yield at x = εcu·d / (εcu + εy) and,
+    when εcu > εy, compression yield at x = εcu·d / (εcu − εy). The block
+    reaches the bottom fibre at x = h / λ. Compression-yield points beyond
+    h/λ are kept: the deepest one is where the squash load is reached.
+
+    Parameters:
+        depths_mm (np.ndarray): Bar depths from top fiber (mm)
+        f_yd (float): Design yield strength of steel (MPa)
+        depth_mm (float): Section depth (mm)
+        eps_cu (float): Ultimate concrete strain
+
+    Returns:
+        np.ndarray: Sorted unique positive breakpoints, h/λ included
+    """
+    eps_y = f_yd / E_S
+    points = [eps_cu * depths_mm / (eps_cu + eps_y)]
+    if eps_cu > eps_y:
+        points.append(eps_cu * depths_mm / (eps_cu - eps_y))
+    points.append([depth_mm / LAMBDA])
+
+    x = np.concatenate(points)
+    return np.unique(x[x > 0])
+
+
+def _chord_deviation(xa, xb, xm, scale) -> np.ndarray:
+    """Distance of each midpoint from its chord, in scaled (N, M) units."""
+    a = np.column_stack(xa) / scale
+    b = np.column_stack(xb) / scale
+    m = np.column_stack(xm) / scale
+
+    chord = b - a
+    offset = m - a
+    length = np.hypot(chord[:, 0], chord[:, 1])
+    cross = np.abs(chord[:, 0] * offset[:, 1] - chord[:, 1] * offset[:, 0])
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(length > 0, cross / length, np.hypot(offset[:, 0], offset[:, 1]))
+
+
+def adaptive_section_diagram(
+    section,
+    material,
+    layout,
+    rel_tol: float = 1e-3,
+    initial_steps: int = 8,
+    max_points: int = 2000,
+    eps_cu: float = EPS_CU
+) -> InteractionArrays:
+    """
+    N–M diagram with neutral-axis samples concentrated where the envelope curves.
+
+    Starts from a coarse grid (uniform up to h/λ, geometric beyond it up to
+    the deepest compression-yield point) plus the exact yield breakpoints of
+    every RebarGroup, then bisects (all flagged intervals at once) every
+    interval whose midpoint lies further than the tolerance from its chord.
+
+    Parameters:
+        section (Section): Section geometry
+        material (Material): Material with fcd and fyd
+        layout (RebarLayout): Reinforcement layout
+        rel_tol (float): Chordal tolerance as a fraction of the squash load
+            (for N) and squash load × h/2 (for M)
+        initial_steps (int): Uniform intervals in the starting grid
+        max_points (int): Hard cap on section evaluations
+        eps_cu (float): Ultimate concrete strain
+
+    Returns:
+        InteractionArrays: From pure tension (x = 0) to squash load (x = inf)
+    """
+    areas, depths = layout.as_arrays()
+    x_max = section.depth_mm / LAMBDA
+
+    N_ref = ALPHA_CC * material.fcd * section.area_mm2 + material.fyd * areas.sum()
+    scale = np.array([rel_tol * N_ref, rel_tol * N_ref * section.depth_mm / 2])
+
+    breaks = yield_breakpoints(depths, material.fyd, section.depth_mm, eps_cu)
+    if eps_cu > material.fyd / E_S:
+        x_far = breaks.max()   # deepest compression yield: squash load reached
+    else:
+        x_far = FAR_DEPTH_RATIO * section.depth_mm   # bars approach yield only asymptotically
+
+    x = np.union1d(
+        np.concatenate([
+            x_max * np.arange(initial_steps + 1) / initial_steps,
+            np.geomspace(x_max, x_far, initial_steps + 1)[1:] if x_far > x_max else [],
+        ]),
+        breaks
+    )
+    pts = solve_section(x, section, material, layout, eps_cu)
+    N, M = pts.axial_force_N, pts.bending_moment_Nmm
+
+    # Intervals still to be checked, as left-node indices into x
+    pending = np.arange(x.size - 1)
+
+    while pending.size and x.size < max_points:
+        pending = pending[:max_points - x.size]
+
+        x_mid = (x[pending] + x[pending + 1]) / 2
+        mid = solve_section(x_mid, section, material, layout, eps_cu)
+
+        deviation = _chord_deviation(
+            (N[pending], M[pending]),
+            (N[pending + 1], M[pending + 1]),
+            (mid.axial_force_N, mid.bending_moment_Nmm),
+            scale
+        )
+        refine = deviation > 1.0
+
+        # Merge midpoints into the sorted sample set
+        order = np.argsort(np.concatenate([x, x_mid]), kind="stable")
+        x = np.concatenate([x, x_mid])[order]
+        N = np.concatenate([N, mid.axial_force_N])[order]
+        M = np.concatenate([M, mid.bending_moment_Nmm])[order]
+
+        # Both halves of a refined interval are checked again
+        x_index = np.searchsorted(x, x_mid[refine])
+        pending = np.sort(np.concatenate([x_index - 1, x_index]))
+
+    squash = solve_section(np.array([np.inf]), section, material, layout, eps_cu)
+    return InteractionArrays(
+        np.append(x, np.inf),
+        np.append(N, squash.axial_force_N),
+        np.append(M, squash.bending_moment_Nmm)
+    )
+
+
+# Optional test block
+if __name__ == "__main__":
+    from materials import Material
+    from section import Section
+    from rebar import RebarLayout
+
+    material = Material(name="C30", fck=30, fyk=500)
+    section = Section(width_mm=300, depth_mm=500)
+    layout = RebarLayout()
+    layout.add_group(20, 3, 50)
+    layout.add_group(20, 3, 450)
+
+    diagram = generate_section_diagram(section, material, layout)
+    print(f"N range: {diagram.axial_force_N.min() / 1e3:.1f} … {diagram.axial_force_N.max() / 1e3:.1f} kN")
+    print(f"M max: {diagram.bending_moment_Nmm.max() / 1e6:.1f} kNm")
@@ -0,0 +1,223 @@
+# service.py
+
+import asyncio
+import json
+import sys
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from batch_runner import build_member
+from diagram_cache import DiagramCache, diagram_key
+from envelope import InteractionEnvelope
+
+# Envelopes are the in-memory store; raw diagrams are only kept for a few
+# recent 'diagram' requests (plus the optional disk tier), not twice over
+DIAGRAM_ENTRIES = 8
+
+
+class EnvelopeService:
+    """
+    Long-lived evaluator that keeps section envelopes warm between requests.
+
+    Requests are dicts (one JSON line each) with an "op" and, for section
+    operations, a "member" entry in the batch schedule format:
+
+        {"id": 1, "op": "check", "member": {...}, "loads": [[N, M], ...]}
+        {"id": 2, "op": "capacity", "member": {...}, "N": [N, ...]}
+        {"id": 3, "op": "diagram", "member": {...}}
+        {"id": 4, "op": "stats"}            {"id": 5, "op": "ping"}
+
+    Forces are in N and N·mm, compression positive. A warm check is a dict
+    lookup plus a searchsorted. Cold envelopes are built on a background
+    thread (one, since DiagramCache is not thread-safe), so they never
+    stall warm checks; concurrent requests for one section share a build.
+
+    Parameters:
+        steps (int): Neutral-axis steps per diagram
+        max_entries (int): Envelopes kept in memory before LRU eviction
+        cache_dir (str, optional): On-disk diagram cache shared with batch runs
+    """
+
+    def __init__(self, steps: int = 200, max_entries: int = 1024, cache_dir: str = None):
+        self.steps = steps
+        self.max_entries = max_entries
+        self.diagrams = DiagramCache(max_entries=DIAGRAM_ENTRIES, cache_dir=cache_dir)
+        self.requests = 0
+        self._envelopes = OrderedDict()
+        self._pending = {}
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+    async def envelope(self, member: dict) -> tuple[str, InteractionEnvelope]:
+        """Returns (key, envelope) for a schedule entry, building it at most once."""
+        section, material, layout = build_member(member)
+        key = diagram_key(section, material, layout, self.steps)
+
+        envelope = self._envelopes.get(key)
+        if envelope is not None:
+            self._envelopes.move_to_end(key)
+            return key, envelope
+
+        pending = self._pending.get(key)
+        if pending is None:
+            loop = asyncio.get_running_loop()
+            pending = loop.run_in_executor(self._executor, self._build, section, material, layout)
+            self._pending[key] = pending
+        try:
+            envelope = await pending
+        finally:
+            self._pending.pop(key, None)
+
+        self._envelopes[key] = envelope
+        if len(self._envelopes) > self.max_entries:
+            self._envelopes.popitem(last=False)
+        return key, envelope
+
+    def _build(self, section, material, layout) -> InteractionEnvelope:
+        return InteractionEnvelope(
+            self.diagrams.get_or_compute(section, material, layout, self.steps),
+            self.diagrams.get_or_compute_hogging(section, material, layout, self.steps)
+        )
+
+    async def handle(self, request: dict) -> dict:
+        """Answers one request; errors come back as {"ok": false, "error": ...}."""
+        self.requests += 1
+        request_id = request.get('id')
+        response = {'id': request_id, 'ok': True}
+        try:
+            op = request.get('op', 'check')
+
+            if op == 'ping':
+                return response
+
+            if op == 'stats':
+                response.update({
+                    'requests': self.requests,
+                    'envelopes': len(self._envelopes),
+                    'diagram_hits': self.diagrams.hits,
+                    'diagram_misses': self.diagrams.misses,
+                })
+                return response
+
+            if op == 'diagram':
+                # Raw diagram only, so sections without a valid envelope can still be inspected
+                section, material, layout = build_member(request['member'])
+                loop = asyncio.get_running_loop()
+                diagram = await loop.run_in_executor(
+                    self._executor, self.diagrams.get_or_compute, section, material, layout, self.steps
+                )
+                response.update({
+                    'axial_force_N': diagram.axial_force_N.tolist(),
+                    'bending_moment_Nmm': diagram.bending_moment_Nmm.tolist(),
+                })
+                return response
+
+            key, envelope = await self.envelope(request['member'])
+            response['key'] = key
+
+            if op == 'check':
+                loads = np.asarray(request.get('loads', []), dtype=float).reshape(-1, 2)
+                utilisation = envelope.utilisation(loads[:, 0], loads[:, 1])
+                governing = int(np.argmax(utilisation)) if utilisation.size else None
+                max_util = float(utilisation[governing]) if utilisation.size else 0.0
+                response.update({
+                    'utilisation': utilisation.tolist(),
+                    'max_utilisation': max_util,
+                    'governing_load': governing,
+                    'passes': max_util <= 1.0,
+                })
+            elif op == 'capacity':
+                N = np.atleast_1d(np.asarray(request['N'], dtype=float))
+                M_Rd = envelope.moment_capacity(N)
+                response['moment_capacity_Nmm'] = [None if np.isnan(m) else m for m in M_Rd.tolist()]
+            else:
+                raise ValueError(f"Unknown op '{op}'")
+
+        except Exception as e:
+            # Any bad request becomes an error reply; it must never kill the connection task
+            response = {'id': request_id, 'ok': False, 'error': f"{type(e).__name__}: {e}"}
+        return response
+
+    async def handle_line(self, line: bytes) -> bytes:
+        """JSON line in, JSON line out."""
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as e:
+            return (json.dumps({'id': None, 'ok': False, 'error': f"Bad JSON: {e}"}) + "\n").encode()
+        if not isinstance(request, dict):
+            return (json.dumps({'id': None, 'ok': False, 'error': "Request must be a JSON object"}) + "\n").encode()
+        return (json.dumps(await self.handle(request)) + "\n").encode()
+
+
+async def _serve_stream(service: EnvelopeService, reader: asyncio.StreamReader, write):
+    """
+    Reads request lines and answers each in its own task, so slow builds
+    never block warm checks. write is a coroutine function that sends (and
+    drains) one response.
+    """
+    tasks = set()
+
+    async def answer(line: bytes):
+        await write(await service.handle_line(line))
+
+    while line := await reader.readline():
+        if not line.strip():
+            continue
+        task = asyncio.create_task(answer(line))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+    if tasks:
+        await asyncio.gather(*tasks)
+
+
+async def serve_stdio(service: EnvelopeService):
+    """Serves JSON lines on stdin/stdout until stdin closes."""
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader()
+    await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+
+    out = sys.stdout.buffer
+
+    async def write(data: bytes):
+        out.write(data)
+        out.flush()
+
+    await _serve_stream(service, reader, write)
+
+
+async def serve_unix(service: EnvelopeService, path: str):
+    """Serves JSON lines to any number of clients on a UNIX socket."""
+    async def client(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        async def write(data: bytes):
+            writer.write(data)
+            await writer.drain()   # back-pressure per response, so a slow client cannot buffer without bound
+
+        try:
+            await _serve_stream(service, reader, write)
+        finally:
+            writer.close()
+
+    server = await asyncio.start_unix_server(client, path=path)
+    print(f"🔌 Listening on {path}", file=sys.stderr)
+    async with server:
+        await server.serve_forever()
+
+
+def run_service_cli():
+    """Entry point: long-lived service on stdin/stdout or a UNIX socket."""
+    from cli import parse_service_args
+
+    args = parse_service_args()
+    service = EnvelopeService(steps=args['steps'], max_entries=args['max_entries'], cache_dir=args['cache_dir'])
+
+    try:
+        if args['socket']:
+            asyncio.run(serve_unix(service, args['socket']))
+        else:
+            asyncio.run(serve_stdio(service))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    run_service_cli()
@@ -15,4 +15,43 @@ def steel_stress(strain: float, f_yd: float, ε_y: float = 0.002) -> float:
     if abs(strain) <= ε_y:
         return (strain / ε_y) * f_yd
     else:
-        return np.sign(strain) * f_yd
\ No newline at end of file
+        return f_yd if strain > 0 else -f_yd
+
+def steel_stress_array(strain, f_yd: float, ε_y: float = 0.002) -> np.ndarray:
+    """
+    Vectorized steel_stress for strain arrays of any shape.
+
+    Elastic-perfectly-plastic law evaluated as a single clip, so a whole
+    (n_x × n_bars) strain grid is handled in one call.
+
+    Parameters:
+    - strain (array-like): Strains at the bar locations
+    - f_yd (float): Design yield strength of steel (MPa)
+    - ε_y (float, optional): Yield strain threshold (default = 0.002)
+
+    Returns:
+    - np.ndarray: Stresses in steel (MPa), same shape as strain
+    """
+    strain = np.asarray(strain, dtype=float)
+    return np.clip(strain * (f_yd / ε_y), -f_yd, f_yd)
+
+def bilinear_steel_stress(strain, f_yd: float, E_s: float = 200_000.0, hardening_ratio: float = 0.0) -> np.ndarray:
+    """
+    EC2 bilinear design law for strain arrays of any shape.
+
+    Elastic up to f_yd / E_s, then a branch of slope hardening_ratio × E_s
+    (0 gives the horizontal top branch).
+
+    Parameters:
+    - strain (array-like): Strains, compression positive
+    - f_yd (float): Design yield strength of steel (MPa)
+    - E_s (float, optional): Elastic modulus (default = 200 000 MPa)
+    - hardening_ratio (float, optional): Post-yield slope as a fraction of E_s
+
+    Returns:
+    - np.ndarray: Stresses in steel (MPa), same shape as strain
+    """
+    strain = np.asarray(strain, dtype=float)
+    ε_y = f_yd / E_s
+    # Perfectly plastic part as one clip, plus the hardening slope on the strain beyond ±ε_y
+    return np.clip(strain * E_s, -f_yd, f_yd) + hardening_ratio * E_s * (strain - np.clip(strain, -ε_y, ε_y))
@@ -0,0 +1,7 @@
+# conftest.py
+
+import os
+import sys
+
+# Modules live flat in src/ and import each other by bare name
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
@@ -0,0 +1,36 @@
+# test_batch_runner.py
+
+from batch_runner import run_batch
+
+GOOD = {
+    "id": "C1", "fck": 30, "fyk": 500, "width_mm": 300, "depth_mm": 500,
+    "rebar": [{"diameter": 20, "count": 3, "depth": 50}, {"diameter": 20, "count": 3, "depth": 450}],
+    "loads": [[1e6, 50e6]],
+}
+
+
+def test_bad_rows_are_recorded_without_aborting_the_batch():
+    bad = [
+        dict(GOOD, id="null-fck", fck=None),
+        dict(GOOD, id="scalar-rebar", rebar=5),
+        dict(GOOD, id="null-code", code=None),
+        dict(GOOD, id="missing-depth", depth_mm=None),
+    ]
+    rows = run_batch([GOOD] + bad, workers=1, steps=40)
+
+    assert rows[0]["error"] == "" and rows[0]["passes"]
+    for row in rows[1:]:
+        assert row["error"] and row["passes"] is False
+
+
+def test_pool_run_streams_every_member(tmp_path):
+    from export import DiagramStreamWriter, read_diagram_stream
+
+    members = [dict(GOOD, id=f"C{i}", width_mm=250 + 10 * (i % 5)) for i in range(12)]
+    with DiagramStreamWriter(out_dir=str(tmp_path), fmt="npy", name="batch") as writer:
+        rows = run_batch(members, workers=2, chunk_size=1, steps=40, writer=writer)
+
+    assert [row["id"] for row in rows] == [m["id"] for m in members]
+    index, _, checks = read_diagram_stream(str(tmp_path), "batch")
+    assert sorted(entry["section_id"] for entry in index) == sorted(m["id"] for m in members)
+    assert checks.size == len(members)
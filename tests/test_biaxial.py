@@ -0,0 +1,30 @@
+# test_biaxial.py
+
+import numpy as np
+from materials import Material
+from section import Section
+from rebar import RebarLayout
+from section_solver import generate_section_diagram
+from biaxial import _meridian, bars_from_layout
+
+
+def test_principal_meridian_matches_uniaxial_diagram():
+    """Compression on top (θ = π/2) is plain bending about y, including near the squash load."""
+    material = Material(name="C30", fck=30, fyk=500)
+    section = Section(width_mm=300, depth_mm=500)
+    layout = RebarLayout()
+    for depth in np.linspace(50, 450, 7):
+        layout.add_group(20, 2, float(depth))
+
+    N, My, _ = _meridian(
+        np.pi / 2, section.width_mm, section.depth_mm, material.fcd, material.fyd,
+        bars_from_layout(layout, section), 100, 40, 0.0035
+    )
+    uniaxial = generate_section_diagram(section, material, layout, steps=100)
+
+    levels = np.array([-1e6, 0.0, 1e6, 3e6, 4.4e6])
+    order = np.argsort(N)
+    reference = np.argsort(uniaxial.axial_force_N)
+    biaxial_M = np.interp(levels, N[order], My[order])
+    uniaxial_M = np.interp(levels, uniaxial.axial_force_N[reference], uniaxial.bending_moment_Nmm[reference])
+    np.testing.assert_allclose(biaxial_M, uniaxial_M, rtol=0.01)
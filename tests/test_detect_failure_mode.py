@@ -0,0 +1,51 @@
+# test_detect_failure_mode.py
+
+import numpy as np
+from materials import Material
+from section import Section
+from rebar import RebarLayout
+from section_solver import solve_section
+from interaction_diagram import generate_interaction_diagram_with_modes
+from detect_failure_mode import (
+    FailureMode, MODE_KEYS, balanced_neutral_axis, decode_failure_modes, detect_failure_modes, ultimate_strains
+)
+
+
+def test_under_reinforced_beam_is_tension_controlled():
+    """2ø12 in a 300×500 C30/B500 beam: at N = 0 the steel yields long before the concrete crushes."""
+    section = Section(width_mm=300, depth_mm=500)
+    material = Material(name="C30", fck=30, fyk=500)
+    layout = RebarLayout()
+    layout.add_group(12, 2, 450)
+
+    x = np.linspace(1.0, section.depth_mm, 5001)
+    N = solve_section(x, section, material, layout).axial_force_N
+    x_pure_bending = x[np.argmin(np.abs(N))]
+
+    assert x_pure_bending < balanced_neutral_axis(450, material.fyd)
+    code = detect_failure_modes(*ultimate_strains(x_pure_bending, 450), eps_y=material.fyd / 200000)
+    assert decode_failure_modes(code) == [FailureMode.TENSION_CONTROLLED]
+
+
+def test_pivot_strains_stay_within_limits():
+    x = np.linspace(0, 1000, 101)
+    top, steel = ultimate_strains(x, 450)
+    assert np.all(top <= 0.0035 + 1e-12)
+    assert np.all(steel <= 0.010 + 1e-12)
+
+
+def test_mode_boundary_is_balanced_neutral_axis():
+    fyd = 500 / 1.15
+    x_b = balanced_neutral_axis(450, fyd)
+    x = np.array([0.5, 0.99, 1.0, 1.01, 1.5]) * x_b
+    modes = decode_failure_modes(detect_failure_modes(*ultimate_strains(x, 450), eps_y=fyd / 200000))
+    assert modes == [FailureMode.TENSION_CONTROLLED] * 2 + [FailureMode.BALANCED] + [FailureMode.COMPRESSION_CONTROLLED] * 2
+
+
+def test_diagram_rows_change_mode_at_the_balanced_point():
+    rows = generate_interaction_diagram_with_modes(300, 500, 20, steps=20)
+    modes = [row['failure_mode'] for row in rows]
+    assert set(modes) <= set(MODE_KEYS)
+    assert modes.count("balanced") == 1
+    b = modes.index("balanced")
+    assert set(modes[:b]) == {"tension"} and set(modes[b + 1:]) == {"compression"}
@@ -0,0 +1,58 @@
+# test_envelope.py
+
+import numpy as np
+import pytest
+from materials import Material
+from section import Section
+from rebar import RebarLayout
+from section_solver import generate_section_diagram, hogging_section_diagram
+from envelope import InteractionEnvelope
+from batch_runner import run_batch
+
+SECTION = Section(width_mm=300, depth_mm=500)
+MATERIAL = Material(name="C30", fck=30, fyk=500)
+
+
+def asymmetric_layout() -> RebarLayout:
+    """2ø12 top, 4ø25 bottom: a typical beam, far from symmetric."""
+    layout = RebarLayout()
+    layout.add_group(12, 2, 50)
+    layout.add_group(25, 4, 450)
+    return layout
+
+
+def test_asymmetric_envelope_uses_the_flipped_section_for_hogging():
+    layout = asymmetric_layout()
+    envelope = InteractionEnvelope(
+        generate_section_diagram(SECTION, MATERIAL, layout), hogging_section_diagram(SECTION, MATERIAL, layout)
+    )
+    sagging_Rd = envelope.moment_capacity(0.0)
+    flipped = layout.flipped(SECTION.depth_mm)
+    hogging_Rd = InteractionEnvelope(
+        generate_section_diagram(SECTION, MATERIAL, flipped), hogging_section_diagram(SECTION, MATERIAL, flipped)
+    ).moment_capacity(0.0)
+
+    assert hogging_Rd < 0.5 * sagging_Rd
+    assert envelope.utilisation([0.0, 0.0], [sagging_Rd, -hogging_Rd]) == pytest.approx([1.0, 1.0], rel=1e-3)
+
+
+def test_symmetric_hogging_branch_equals_mirror():
+    layout = RebarLayout()
+    layout.add_group(20, 3, 50)
+    layout.add_group(20, 3, 450)
+    diagram = generate_section_diagram(SECTION, MATERIAL, layout)
+    hogging = hogging_section_diagram(SECTION, MATERIAL, layout)
+
+    rng = np.random.default_rng(3)
+    N, M = rng.uniform(-1e6, 4e6, 500), rng.uniform(-4e8, 4e8, 500)
+    assert InteractionEnvelope(diagram, hogging).utilisation(N, M) == pytest.approx(InteractionEnvelope(diagram).utilisation(N, M))
+
+
+def test_batch_checks_asymmetric_beam():
+    member = {
+        "id": "B1", "fck": 30, "fyk": 500, "width_mm": 300, "depth_mm": 500,
+        "rebar": [{"diameter": 12, "count": 2, "depth": 50}, {"diameter": 25, "count": 4, "depth": 450}],
+        "loads": [[0.0, 200e6], [0.0, -30e6]],
+    }
+    row = run_batch([member], workers=1, steps=100)[0]
+    assert row["error"] == "" and row["passes"]
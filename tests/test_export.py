@@ -0,0 +1,23 @@
+# test_export.py
+
+import numpy as np
+from interaction_diagram import InteractionArrays
+from export import DiagramStreamWriter, read_diagram_stream
+
+
+def test_npy_stream_is_columnar_and_loadable(tmp_path):
+    first = InteractionArrays(np.arange(3.0), np.arange(3.0) * 10, np.arange(3.0) * 100)
+    second = InteractionArrays(np.arange(2.0), -np.arange(2.0), np.ones(2))
+    with DiagramStreamWriter(out_dir=str(tmp_path), fmt="npy", name="run") as writer:
+        writer.write_diagram("A", first)
+        writer.write_checks("A", [0.5, 1.2])
+        writer.write_diagram("B", second)
+
+    # Each column is an ordinary .npy file
+    assert np.load(tmp_path / "run_axial_force_N.npy").tolist() == [0.0, 10.0, 20.0, -0.0, -1.0]
+
+    index, diagrams, checks = read_diagram_stream(str(tmp_path), "run")
+    b = index[1]
+    rows = slice(b['diagram_offset'], b['diagram_offset'] + b['diagram_rows'])
+    assert diagrams.bending_moment_Nmm[rows].tolist() == [1.0, 1.0]
+    assert checks.tolist() == [0.5, 1.2] and b['check_rows'] == 0
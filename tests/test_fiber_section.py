@@ -0,0 +1,60 @@
+# test_fiber_section.py
+
+import numpy as np
+import pytest
+import fiber_section
+from section import Section, HollowSection, TSection
+from steel_stress import bilinear_steel_stress
+
+
+@pytest.mark.parametrize("wall", [0.0, -10.0, 150.0, 250.0])
+def test_hollow_section_rejects_walls_without_a_void(wall):
+    with pytest.raises(ValueError):
+        HollowSection(width_mm=300, depth_mm=500, wall_mm=wall)
+
+
+def test_mesh_cache_is_bounded():
+    for width in range(fiber_section.MESH_CACHE_ENTRIES + 10):
+        fiber_section.mesh_section(Section(width_mm=200 + width, depth_mm=500), n_layers=10)
+    assert len(fiber_section._mesh_cache) == fiber_section.MESH_CACHE_ENTRIES
+
+
+def test_bilinear_law_with_hardening():
+    strain = np.array([-0.01, -0.001, 0.0, 0.001, 0.01])
+    stress = bilinear_steel_stress(strain, 400.0, 200_000.0, hardening_ratio=0.01)
+    assert stress.tolist() == pytest.approx([-416.0, -200.0, 0.0, 200.0, 416.0])
+
+
+def test_ultimate_planes_respect_steel_strain_limit():
+    from materials import Material
+    from rebar import RebarLayout
+
+    layout = RebarLayout()
+    depths = np.linspace(50, 450, 7)
+    for depth in depths:
+        layout.add_group(20, 2, depth)
+    engine = fiber_section.FiberSection(
+        Section(width_mm=300, depth_mm=500), Material(name="C30", fck=30, fyk=500), layout, hardening_ratio=0.01
+    )
+
+    _, top, bottom = engine.ultimate_planes()
+    bar_strains = top[:, None] + (bottom - top)[:, None] * depths[None, :] / 500
+    assert bar_strains.min() >= -engine.eps_ud - 1e-12
+
+    # Pure tension at x = 0 is the lowest axial resistance, hardening included
+    diagram = engine.diagram()
+    assert diagram.axial_force_N.min() == pytest.approx(diagram.axial_force_N[0])
+    assert diagram.axial_force_N[0] < -layout.total_area() * engine.material.fyd
+
+
+@pytest.mark.parametrize("web, flange", [(0.0, 100.0), (700.0, 100.0), (250.0, 0.0), (250.0, 500.0)])
+def test_t_section_rejects_degenerate_dimensions(web, flange):
+    with pytest.raises(ValueError):
+        TSection(width_mm=600, depth_mm=500, web_width_mm=web, flange_depth_mm=flange)
+
+
+def test_t_section_requires_web_and_flange():
+    with pytest.raises(TypeError):
+        TSection(width_mm=600, depth_mm=500)
+    section = TSection(width_mm=600, depth_mm=500, web_width_mm=250, flange_depth_mm=120)
+    assert fiber_section.mesh_section(section).area_mm2.sum() == pytest.approx(section.area_mm2, rel=1e-3)
@@ -0,0 +1,39 @@
+# test_load_check.py
+
+import numpy as np
+import pytest
+from materials import Material
+from section import Section
+from rebar import RebarLayout
+from section_solver import generate_section_diagram, hogging_section_diagram
+from envelope import InteractionEnvelope
+from load_check import check_loads_batch
+
+
+def test_raw_diagram_matches_prebuilt_envelope():
+    layout = RebarLayout()
+    layout.add_group(20, 3, 50)
+    layout.add_group(20, 3, 450)
+    diagram = generate_section_diagram(Section(width_mm=300, depth_mm=500), Material(name="C30", fck=30, fyk=500), layout)
+
+    rng = np.random.default_rng(0)
+    N = np.append(rng.uniform(-1e6, 4e6, 1000), 0.0)
+    M = np.append(rng.uniform(-4e8, 4e8, 1000), 0.0)
+
+    raw = check_loads_batch(N, M, diagram)
+    assert raw.utilisation == pytest.approx(InteractionEnvelope(diagram).utilisation(N, M))
+    assert raw.utilisation[-1] == 0.0
+    assert np.array_equal(raw.is_safe, raw.utilisation <= 1.0)
+
+
+def test_raw_asymmetric_diagram_with_hogging_branch():
+    layout = RebarLayout()
+    layout.add_group(12, 2, 50)
+    layout.add_group(25, 4, 450)
+    section, material = Section(width_mm=300, depth_mm=500), Material(name="C30", fck=30, fyk=500)
+
+    result = check_loads_batch(
+        [0.0, 0.0], [200e6, -30e6],
+        generate_section_diagram(section, material, layout), hogging_section_diagram(section, material, layout)
+    )
+    assert result.is_safe.all()
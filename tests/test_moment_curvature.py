@@ -0,0 +1,32 @@
+# test_moment_curvature.py
+
+import numpy as np
+import pytest
+from materials import Material
+from section import Section
+from rebar import RebarLayout
+from fiber_section import EPS_UD
+from moment_curvature import moment_curvature
+
+
+@pytest.fixture
+def beam():
+    layout = RebarLayout()
+    layout.add_group(16, 2, 50)
+    layout.add_group(20, 4, 450)
+    return Section(width_mm=300, depth_mm=500), Material(name="C30", fck=30, fyk=500), layout
+
+
+def test_curve_ends_at_concrete_crushing(beam):
+    section, material, layout = beam
+    curve = moment_curvature(section, material, layout, axial_force_N=200e3)
+    assert curve.eps_top[-1] == pytest.approx(0.0035)
+    assert np.all(np.diff(curve.curvature_per_mm) > 0)
+
+
+def test_curve_ends_at_steel_limit_under_tension(beam):
+    section, material, layout = beam
+    curve = moment_curvature(section, material, layout, axial_force_N=-300e3)
+    eps_steel = curve.curvature_per_mm[-1] * (450 - curve.neutral_axis_mm[-1])
+    assert eps_steel == pytest.approx(EPS_UD)
+    assert curve.eps_top[-1] < 0.0035
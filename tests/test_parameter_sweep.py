@@ -0,0 +1,24 @@
+# test_parameter_sweep.py
+
+import numpy as np
+import pytest
+from materials import Material
+from section import Section
+from rebar import RebarLayout
+from section_solver import generate_section_diagram
+from parameter_sweep import capacity_sweep
+
+
+def test_sweep_matches_section_diagram():
+    b, h, rho, cover_ratio = 300.0, 500.0, 0.02, 0.1
+    table = capacity_sweep([b], [h], [30], [500], [rho], cover_ratio=cover_ratio, steps=200)
+
+    layout = RebarLayout()
+    bar = np.sqrt(4 * rho * b * h / 2 / np.pi)   # one bar per face carrying As/2
+    layout.add_group(bar, 1, cover_ratio * h)
+    layout.add_group(bar, 1, (1 - cover_ratio) * h)
+    diagram = generate_section_diagram(Section(width_mm=b, depth_mm=h), Material(name="C30", fck=30, fyk=500), layout)
+
+    assert table.max_axial_N.item() == pytest.approx(diagram.axial_force_N.max())
+    assert table.min_axial_N.item() == pytest.approx(diagram.axial_force_N.min())
+    assert table.max_moment_Nmm.item() == pytest.approx(diagram.bending_moment_Nmm.max())
@@ -0,0 +1,30 @@
+# test_service.py
+
+import asyncio
+import json
+from service import EnvelopeService
+
+MEMBER = {
+    "fck": 30, "fyk": 500, "width_mm": 300, "depth_mm": 500,
+    "rebar": [{"diameter": 20, "count": 3, "depth": 50}, {"diameter": 20, "count": 3, "depth": 450}],
+}
+
+
+def ask(service, payload) -> dict:
+    line = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+    return json.loads(asyncio.run(service.handle_line(line)))
+
+
+def test_malformed_requests_get_error_replies():
+    service = EnvelopeService(steps=40)
+    for payload in (b"{not json", [1, 2], "x", 5, {"op": "check", "member": 5}, {"op": "check", "member": [1]}):
+        reply = ask(service, payload)
+        assert reply["ok"] is False and reply["error"]
+
+
+def test_check_reuses_warm_envelope():
+    service = EnvelopeService(steps=40)
+    for _ in range(2):
+        reply = ask(service, {"id": 7, "op": "check", "member": MEMBER, "loads": [[1e6, 50e6]]})
+        assert reply["id"] == 7 and reply["ok"] and reply["passes"]
+    assert ask(service, {"op": "stats"})["diagram_misses"] == 1